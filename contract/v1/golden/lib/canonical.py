@@ -2,13 +2,104 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Set, Tuple, Union
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
-def sha256_file(path: Path) -> str:
-    data = path.read_bytes()
-    return hashlib.sha256(data).hexdigest()
+# orjson formats floats differently from stdlib ("1e16" vs "1e+16", "0.00001"
+# vs "1e-05"), writes NaN/Infinity as null, and serializes types stdlib rejects
+# (datetime, UUID, Enum, dataclasses, ...). It is only used for values built from
+# exactly dict/list/tuple/str/int/bool/None, where both encoders agree.
+_ORJSON_SCALARS = frozenset((str, int, bool, type(None)))
+_LONG_DIGIT_RUN = re.compile(rb"[0-9]{19}")
+
+# json.dumps(obj, **opts) builds a fresh JSONEncoder per call; the canonical
+# options never change, so configure the two encoders once.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":"), indent=2)
+_COMPACT_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+_ORJSON_COMPACT = orjson.OPT_SORT_KEYS if orjson is not None else 0
+
+
+_HASH_CHUNK = 1 << 20
+
+PathLike = Union[str, Path]
+
+# File digest memo keyed by (algo, path, inode, mtime_ns, size). A file rewritten
+# within the filesystem's timestamp granularity can keep its mtime, so (like git's
+# racy-clean check) only digests of files older than this window are remembered.
+_FILE_DIGEST_CACHE: Dict[Tuple[str, str, int, int, int], str] = {}
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Not available on Windows/macOS.
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None) if hasattr(os, "posix_fadvise") else None
+
+
+def memoized_file_digest(path: PathLike, algo: str, compute: Callable[[PathLike], str]) -> str:
+    """
+    compute(path), remembered per process under (algo, path, inode, mtime_ns, size)
+    with the racy-window rule above. Also used by contract/v1/harness/run_replay
+    for its fingerprints, so both caches go stale the same way.
+    """
+    st = os.stat(path)
+    key = (algo, os.fspath(path), st.st_ino, st.st_mtime_ns, st.st_size)
+    digest = _FILE_DIGEST_CACHE.get(key)
+    if digest is None:
+        digest = compute(path)
+        _remember_digest(key, st, digest)
+    return digest
+
+
+def _remember_digest(key: Tuple[str, str, int, int, int], st: os.stat_result, digest: str) -> None:
+    if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+        _FILE_DIGEST_CACHE[key] = digest
+
+
+memoized_file_digest.cache_clear = _FILE_DIGEST_CACHE.clear  # type: ignore[attr-defined]
+
+
+def sha256_file(path: PathLike) -> str:
+    return memoized_file_digest(path, "sha256", _sha256_file_uncached)
+
+
+sha256_file.cache_clear = _FILE_DIGEST_CACHE.clear  # type: ignore[attr-defined]
+
+
+def _sha256_file_uncached(path: PathLike) -> str:
+    with open(path, "rb") as f:
+        if _FADV_SEQUENTIAL is not None:
+            # Whole-file sequential scan: ask the kernel for aggressive readahead.
+            os.posix_fadvise(f.fileno(), 0, 0, _FADV_SEQUENTIAL)
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # Python < 3.11: stream through a reused buffer instead of read_bytes().
+        h = hashlib.sha256()
+        buf = bytearray(_HASH_CHUNK)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+        return h.hexdigest()
+
+
+def sha256_files(paths: Sequence[Union[str, Path]]) -> List[str]:
+    """
+    SHA-256 of several independent files, in input order.
+    hashlib releases the GIL while hashing, so the files are hashed concurrently.
+    """
+    if len(paths) <= 1:
+        return [sha256_file(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+        return list(ex.map(sha256_file, paths))
 
 
 def sha256_bytes(data: bytes) -> str:
@@ -24,7 +115,7 @@ def canonical_json_bytes(obj: Any) -> bytes:
       - indent=2
       - newline at EOF
     """
-    s = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"), indent=2)
+    s = _CANONICAL_ENCODER.encode(obj)
     return (s + "\n").encode("utf-8")
 
 
@@ -34,20 +125,99 @@ def canonical_jsonl_bytes(objs: Iterable[Any]) -> bytes:
       - each line is canonical JSON object compressed to one line with sorted keys
       - newline at EOF
     """
-    lines: List[str] = []
+    buf = bytearray()
     for obj in objs:
-        line = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
-        lines.append(line)
-    return ("\n".join(lines) + "\n").encode("utf-8")
+        buf += _compact_json_bytes(obj)
+        buf += b"\n"
+    # An empty ledger is still a single newline, as it always has been.
+    return bytes(buf) or b"\n"
+
+
+def _orjson_safe(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        t = type(o)
+        if t is dict:
+            if not all(type(k) is str for k in o):
+                return False
+            stack.extend(o.values())
+        elif t is list or t is tuple:
+            stack.extend(o)
+        elif t not in _ORJSON_SCALARS:
+            return False
+    return True
+
+
+def orjson_bytes(obj: Any, option: int) -> bytes | None:
+    """
+    orjson.dumps(obj, option=option) when that is byte-identical to the stdlib
+    encoding, else None (orjson missing, a float, a non-str key, a subclass or any
+    other type, an integer beyond 64 bits) and the caller encodes with stdlib.
+    Shared with contract/v1/harness so both use the same rule.
+    """
+    if orjson is None or not _orjson_safe(obj):
+        return None
+    try:
+        return orjson.dumps(obj, option=option)
+    except TypeError:
+        return None
+
+
+def _compact_json_bytes(obj: Any) -> bytes:
+    # orjson has no separators option for indented output (it always writes ": "),
+    # so it is only used for the compact one-line form, where it matches stdlib.
+    data = orjson_bytes(obj, _ORJSON_COMPACT)
+    if data is not None:
+        return data
+    return _COMPACT_ENCODER.encode(obj).encode("utf-8")
+
+
+# Parent directories already created by write_bytes in this process.
+_KNOWN_DIRS: Set[Path] = set()
 
 
 def write_bytes(path: Path, data: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(data)
+    _write_bytes_and_hash(path, data)
+
+
+def _write_bytes_and_hash(path: Path, data: bytes) -> str:
+    """
+    Atomic write: data lands in a sibling temp file that is then os.replace()d
+    over the target, so a crash never leaves a torn artifact behind.
+    The digest of data is offered to the sha256_file memo under the same
+    racy-window rule, so a freshly written file is still read back from disk
+    (e.g. by the golden expected-manifest compare).
+    """
+    parent = path.parent
+    if parent not in _KNOWN_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(parent)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+    except FileNotFoundError:
+        # The directory was removed after it was remembered (e.g. out dir cleaned).
+        parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+    os.replace(tmp, path)
+    digest = sha256_bytes(data)
+    st = path.stat()
+    _remember_digest(("sha256", str(path), st.st_ino, st.st_mtime_ns, st.st_size), st, digest)
+    return digest
 
 
 def load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    data = path.read_bytes()
+    # orjson reads integers beyond 64 bits as floats, so any long digit run is left to stdlib.
+    if orjson is not None and not _LONG_DIGIT_RUN.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Inputs orjson rejects but stdlib accepts (NaN, 1E400, lone surrogate
+            # escapes) keep their stdlib meaning; real errors re-raise below.
+            pass
+    return json.loads(data.decode("utf-8"))
 
 
 def write_canonical_json(path: Path, obj: Any) -> None:
@@ -58,33 +228,54 @@ def write_canonical_jsonl(path: Path, objs: Iterable[Any]) -> None:
     write_bytes(path, canonical_jsonl_bytes(objs))
 
 
+def write_canonical_json_and_hash(path: Path, obj: Any) -> str:
+    return _write_bytes_and_hash(path, canonical_json_bytes(obj))
+
+
+def write_canonical_jsonl_and_hash(path: Path, objs: Iterable[Any]) -> str:
+    return _write_bytes_and_hash(path, canonical_jsonl_bytes(objs))
+
+
 def read_manifest_json(path: Path) -> Dict[str, str]:
     raw = load_json(path)
     if not isinstance(raw, dict):
         raise ValueError(f"Manifest must be a JSON object: {path}")
-    out: Dict[str, str] = {}
-    for k, v in raw.items():
-        if not isinstance(k, str) or not isinstance(v, str):
-            raise ValueError(f"Manifest entries must be string:string in {path}")
-        out[k] = v.lower()
-    return out
+    # JSON object keys are always strings, and .lower() only exists on string
+    # values (JSON has no bytes), so one pass both validates and normalizes.
+    try:
+        return {k: v.lower() for k, v in raw.items()}
+    except AttributeError:
+        raise ValueError(f"Manifest entries must be string:string in {path}") from None
 
 
 def write_manifest_json(path: Path, mapping: Dict[str, str]) -> None:
-    ordered = {k: mapping[k] for k in sorted(mapping.keys())}
-    write_canonical_json(path, ordered)
+    # canonical_json_bytes already sorts keys; no need to pre-order the mapping.
+    write_canonical_json(path, mapping)
+
+
+def _walk_files(root: Path) -> Iterator[str]:
+    """
+    Relative, forward-slash paths of every file under root.
+    Uses os.scandir so file types come from the dirent instead of one stat per entry.
+    """
+    # Each stack item carries its posix prefix, so no per-file relpath/separator fixup.
+    stack = [(str(root), "")]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, prefix + entry.name + "/"))
+                elif entry.is_file():
+                    yield prefix + entry.name
 
 
 def assert_no_extra_or_missing_files(expected: Dict[str, str], out_dir: Path) -> None:
-    actual_files = sorted(
-        str(p.relative_to(out_dir)).replace("\\", "/")
-        for p in out_dir.rglob("*")
-        if p.is_file()
-    )
-    expected_files = sorted(expected.keys())
-
-    missing = [f for f in expected_files if f not in actual_files]
-    extra = [f for f in actual_files if f not in expected_files]
+    actual_files = set(_walk_files(out_dir))
+    expected_files = set(expected)
+
+    missing = sorted(expected_files - actual_files)
+    extra = sorted(actual_files - expected_files)
 
     if missing:
         raise RuntimeError(f"Missing output files: {', '.join(missing)}")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 from pathlib import Path
 from typing import List, Tuple
@@ -9,9 +10,12 @@ from typing import List, Tuple
 # -----------------------------
 # Helpers
 # -----------------------------
+# contract/v1/golden/migrate_gate8_to_python.py -> up 3 => repo root
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
 def repo_root_from_this_file() -> Path:
-    # contract/v1/golden/migrate_gate8_to_python.py -> up 3 => repo root
-    return Path(__file__).resolve().parents[3]
+    return REPO_ROOT
 
 
 def ensure_dir(path: Path, apply: bool, actions: List[str]) -> None:
@@ -22,21 +26,32 @@ def ensure_dir(path: Path, apply: bool, actions: List[str]) -> None:
         path.mkdir(parents=True, exist_ok=True)
 
 
-def write_file(path: Path, content: str, apply: bool, actions: List[str], overwrite: bool = False) -> None:
+def write_file(path: Path, content: bytes, apply: bool, actions: List[str], overwrite: bool = False) -> None:
     if path.exists() and not overwrite:
         actions.append(f"SKIP   {path} (exists)")
         return
     actions.append(f"WRITE  {path}{' (overwrite)' if path.exists() else ''}")
     if apply:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        write_all(path, content)
+
+
+def write_all(path: Path, data: bytes) -> None:
+    # One open and (normally) one write(2); bytes are written as-is, no newline translation.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def move_to_archive(src: Path, archive_root: Path, apply: bool, actions: List[str]) -> None:
     if not src.exists():
         actions.append(f"SKIP   {src} (missing)")
         return
-    rel = src.relative_to(repo_root_from_this_file())
+    rel = src.relative_to(REPO_ROOT)
     dst = archive_root / rel
     actions.append(f"MOVE   {src} -> {dst}")
     if apply:
@@ -400,7 +415,13 @@ INIT_PY = """\
 # Package marker for golden harness library.
 """
 
-EMPTY_MANIFEST_JSON = "{\n}\n"
+EMPTY_MANIFEST_JSON = b"{\n}\n"
+
+# The harness sources are constants; encode them once rather than on every write.
+INIT_PY_BYTES = INIT_PY.encode("utf-8")
+CANONICAL_PY_BYTES = CANONICAL_PY.encode("utf-8")
+RUN_GOLDEN_PY_BYTES = RUN_GOLDEN_PY.encode("utf-8")
+PIN_GOLDEN_PY_BYTES = PIN_GOLDEN_PY.encode("utf-8")
 
 
 # -----------------------------
@@ -427,7 +448,7 @@ def main() -> int:
     apply = args.apply
     overwrite_py = args.overwrite_python
 
-    repo_root = repo_root_from_this_file()
+    repo_root = REPO_ROOT
     golden_dir = repo_root / "contract" / "v1" / "golden"
     lib_dir = golden_dir / "lib"
     fixtures_dir = golden_dir / "fixtures"
@@ -446,15 +467,18 @@ def main() -> int:
     ensure_dir(out_dir, apply, actions)
     ensure_dir(archive_root, apply, actions)
 
-    # Write python harness files
-    write_file(lib_dir / "__init__.py", INIT_PY, apply, actions, overwrite=overwrite_py)
-    write_file(lib_dir / "canonical.py", CANONICAL_PY, apply, actions, overwrite=overwrite_py)
-    write_file(golden_dir / "run_golden.py", RUN_GOLDEN_PY, apply, actions, overwrite=overwrite_py)
-    write_file(golden_dir / "pin_golden_hashes.py", PIN_GOLDEN_PY, apply, actions, overwrite=overwrite_py)
-
-    # Ensure JSON manifests exist (pin will overwrite fixtures_manifest.json; expected may be filled after pin)
-    write_file(fixtures_dir / "fixtures_manifest.json", EMPTY_MANIFEST_JSON, apply, actions, overwrite=False)
-    write_file(expected_dir / "golden_expected_manifest.json", EMPTY_MANIFEST_JSON, apply, actions, overwrite=False)
+    files_to_write: List[Tuple[Path, bytes, bool]] = [
+        # Python harness files
+        (lib_dir / "__init__.py", INIT_PY_BYTES, overwrite_py),
+        (lib_dir / "canonical.py", CANONICAL_PY_BYTES, overwrite_py),
+        (golden_dir / "run_golden.py", RUN_GOLDEN_PY_BYTES, overwrite_py),
+        (golden_dir / "pin_golden_hashes.py", PIN_GOLDEN_PY_BYTES, overwrite_py),
+        # JSON manifests (pin will overwrite fixtures_manifest.json; expected may be filled after pin)
+        (fixtures_dir / "fixtures_manifest.json", EMPTY_MANIFEST_JSON, False),
+        (expected_dir / "golden_expected_manifest.json", EMPTY_MANIFEST_JSON, False),
+    ]
+    for path, content, overwrite in files_to_write:
+        write_file(path, content, apply, actions, overwrite=overwrite)
 
     # Quarantine legacy Gate 8 artifacts (safe move to archive)
     legacy_paths: List[Path] = [
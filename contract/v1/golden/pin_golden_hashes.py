@@ -1,68 +1,56 @@
 from __future__ import annotations
 
-import hashlib
 import os
 from pathlib import Path
+from typing import Dict, List
 
-from lib.canonical import sha256_file, write_manifest_json
+from lib.canonical import sha256_files, write_manifest_json
 
-RUNNER_VERSION = "v1.0.0"
-DEFAULT_SEED = "1337"
+FIXTURE_FILES = ["interview_payload.json", "case_meta.json", "capability_gateway_mock.json"]
+OUTPUT_FILES = [
+    "export_bundle.json",
+    "case_snapshot.json",
+    "tool_calls.jsonl",
+    "audit_ledger.jsonl",
+    "hashes.json",
+    "workflow_report.json",
+]
+
+# contract/v1/golden/pin_golden_hashes.py -> up 3 => repo root
+REPO_ROOT = Path(__file__).resolve().parents[3]
 
 
 def repo_root_from_this_file() -> Path:
-    # contract/v1/golden/pin_golden_hashes.py -> up 3 => repo root
-    return Path(__file__).resolve().parents[3]
+    return REPO_ROOT
 
 
-def compute_run_id(contract_sha: str, fixtures_sha: str, seed: str) -> str:
-    payload = f"{contract_sha}\n{fixtures_sha}\n{RUNNER_VERSION}\n{seed}".encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+def hash_by_name(base: Path, names: List[str]) -> Dict[str, str]:
+    return dict(zip(names, sha256_files([base / name for name in names])))
 
 
 def main() -> int:
     os.environ.setdefault("TZ", "UTC")
-    seed = os.environ.get("GOLDEN_SEED", DEFAULT_SEED)
 
-    repo_root = repo_root_from_this_file()
+    repo_root = REPO_ROOT
     fixtures_dir = repo_root / "contract" / "v1" / "golden" / "fixtures"
     expected_dir = repo_root / "contract" / "v1" / "golden" / "expected"
-    out_root = repo_root / "contract" / "v1" / "golden" / "out"
-
-    contract_manifest = repo_root / "contract" / "v1" / "contract_manifest.yaml"
 
     # 1) Pin fixtures manifest
     fixtures_manifest_path = fixtures_dir / "fixtures_manifest.json"
-    fixtures = {
-        "interview_payload.json": sha256_file(fixtures_dir / "interview_payload.json"),
-        "case_meta.json": sha256_file(fixtures_dir / "case_meta.json"),
-        "capability_gateway_mock.json": sha256_file(fixtures_dir / "capability_gateway_mock.json"),
-    }
+    fixtures = hash_by_name(fixtures_dir, FIXTURE_FILES)
     write_manifest_json(fixtures_manifest_path, fixtures)
 
-    # 2) Run golden runner WITHOUT compare (bootstrap)
-    from run_golden import main as run_main  # type: ignore
+    # 2) Run golden runner WITHOUT compare (bootstrap); it reports the RUN_ID and
+    #    out dir it derived from the manifests, so nothing is re-hashed here
+    from run_golden import execute as run_execute  # type: ignore
 
     os.environ["GOLDEN_SKIP_COMPARE"] = "1"
-    run_main()
+    _, _, run_id, out_dir = run_execute()
     os.environ.pop("GOLDEN_SKIP_COMPARE", None)
 
-    # 3) Compute RUN_ID so we can locate out dir deterministically
-    contract_sha = sha256_file(contract_manifest)
-    fixtures_sha = sha256_file(fixtures_manifest_path)
-    run_id = compute_run_id(contract_sha, fixtures_sha, seed)
-    out_dir = out_root / run_id
-
-    # 4) Pin expected manifest from outputs
+    # 3) Pin expected manifest from outputs
     expected_manifest_path = expected_dir / "golden_expected_manifest.json"
-    expected = {
-        "export_bundle.json": sha256_file(out_dir / "export_bundle.json"),
-        "case_snapshot.json": sha256_file(out_dir / "case_snapshot.json"),
-        "tool_calls.jsonl": sha256_file(out_dir / "tool_calls.jsonl"),
-        "audit_ledger.jsonl": sha256_file(out_dir / "audit_ledger.jsonl"),
-        "hashes.json": sha256_file(out_dir / "hashes.json"),
-        "workflow_report.json": sha256_file(out_dir / "workflow_report.json"),
-    }
+    expected = hash_by_name(out_dir, OUTPUT_FILES)
     write_manifest_json(expected_manifest_path, expected)
 
     print("PIN COMPLETE ✅")
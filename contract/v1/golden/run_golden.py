@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
+import shutil
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from lib.canonical import (
     assert_no_extra_or_missing_files,
@@ -10,17 +11,22 @@ from lib.canonical import (
     read_manifest_json,
     sha256_bytes,
     sha256_file,
+    sha256_files,
     write_canonical_json,
-    write_canonical_jsonl,
+    write_canonical_json_and_hash,
+    write_canonical_jsonl_and_hash,
 )
 
 RUNNER_VERSION = "v1.0.0"
 DEFAULT_SEED = "1337"
 
 
+# contract/v1/golden/run_golden.py -> up 3 => repo root
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
 def repo_root_from_this_file() -> Path:
-    # contract/v1/golden/run_golden.py -> up 3 => repo root
-    return Path(__file__).resolve().parents[3]
+    return REPO_ROOT
 
 
 def compute_run_id(contract_manifest_sha: str, fixtures_manifest_sha: str, seed: str) -> str:
@@ -29,28 +35,25 @@ def compute_run_id(contract_manifest_sha: str, fixtures_manifest_sha: str, seed:
 
 
 def clean_dir(path: Path) -> None:
-    if not path.exists():
-        return
-    for p in sorted(path.rglob("*"), reverse=True):
-        if p.is_file():
-            p.unlink()
-        else:
-            try:
-                p.rmdir()
-            except OSError:
-                pass
+    # Only a missing directory is fine; any other failure (e.g. a locked file)
+    # must surface here rather than as a confusing error from mkdir later.
     try:
-        path.rmdir()
-    except OSError:
+        shutil.rmtree(path)
+    except FileNotFoundError:
         pass
 
 
-def main() -> int:
+def execute() -> Tuple[str, str, str, Path]:
+    """
+    Run the golden workflow.
+    Returns (contract_manifest_sha256, fixtures_manifest_sha256, run_id, out_dir) so
+    callers such as pin_golden_hashes need not re-hash the manifests.
+    """
     # Deterministic env (best effort)
     os.environ.setdefault("TZ", "UTC")
     seed = os.environ.get("GOLDEN_SEED", DEFAULT_SEED)
 
-    repo_root = repo_root_from_this_file()
+    repo_root = REPO_ROOT
 
     contract_manifest = repo_root / "contract" / "v1" / "contract_manifest.yaml"
     fixtures_manifest = repo_root / "contract" / "v1" / "golden" / "fixtures" / "fixtures_manifest.json"
@@ -62,17 +65,18 @@ def main() -> int:
     run_id = compute_run_id(contract_sha, fixtures_sha, seed)
 
     out_dir = repo_root / "contract" / "v1" / "golden" / "out" / run_id
-    if out_dir.exists():
-        clean_dir(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
+    clean_dir(out_dir)
+    # No exist_ok: if anything survived the clean, fail loudly rather than mix runs.
+    out_dir.mkdir(parents=True)
 
     fixtures_dir = repo_root / "contract" / "v1" / "golden" / "fixtures"
 
     # Validate fixture presence per manifest
     fixture_map = read_manifest_json(fixtures_manifest)
+    fixtures_prefix = str(fixtures_dir) + os.sep
     for rel in fixture_map.keys():
-        fp = fixtures_dir / rel
-        if not fp.exists():
+        fp = fixtures_prefix + rel
+        if not os.path.exists(fp):
             raise RuntimeError(f"Missing fixture file: {fp}")
 
     # Load fixtures
@@ -138,16 +142,15 @@ def main() -> int:
         "documents": [],
     }
 
-    # Write outputs
-    write_canonical_json(out_dir / "export_bundle.json", export_bundle)
-    write_canonical_json(out_dir / "case_snapshot.json", case_snapshot)
-    write_canonical_jsonl(out_dir / "tool_calls.jsonl", tool_calls)
-    write_canonical_jsonl(out_dir / "audit_ledger.jsonl", audit)
+    # Write outputs, hashing the core artifacts from the bytes just written
+    hashes: Dict[str, str] = {
+        "export_bundle.json": write_canonical_json_and_hash(out_dir / "export_bundle.json", export_bundle),
+        "case_snapshot.json": write_canonical_json_and_hash(out_dir / "case_snapshot.json", case_snapshot),
+        "tool_calls.jsonl": write_canonical_jsonl_and_hash(out_dir / "tool_calls.jsonl", tool_calls),
+        "audit_ledger.jsonl": write_canonical_jsonl_and_hash(out_dir / "audit_ledger.jsonl", audit),
+    }
 
-    # hashes.json (hash the core artifacts)
-    hashes: Dict[str, str] = {}
-    for name in ["export_bundle.json", "case_snapshot.json", "tool_calls.jsonl", "audit_ledger.jsonl"]:
-        hashes[name] = sha256_file(out_dir / name)
+    # hashes.json
     write_canonical_json(out_dir / "hashes.json", {"files": hashes})
 
     # workflow_report.json (summary)
@@ -168,14 +171,23 @@ def main() -> int:
         expected = read_manifest_json(expected_manifest)
         assert_no_extra_or_missing_files(expected, out_dir)
 
-        for rel, exp_hash in expected.items():
-            actual_hash = sha256_file(out_dir / rel)
+        rels = list(expected)
+        out_prefix = str(out_dir) + os.sep
+        # Hashed from disk: this checks the files as written, not the in-memory digests.
+        actuals = sha256_files([out_prefix + rel for rel in rels])
+        for rel, actual_hash in zip(rels, actuals):
+            exp_hash = expected[rel]
             if actual_hash.lower() != exp_hash.lower():
                 raise RuntimeError(f"Golden mismatch: {rel} expected {exp_hash} got {actual_hash}")
     else:
         print("NOTE: GOLDEN_SKIP_COMPARE enabled (no expected-manifest enforcement for this run).")
 
     print(f"GOLDEN PASS ✅  RUN_ID={run_id}  OUT={out_dir}")
+    return contract_sha, fixtures_sha, run_id, out_dir
+
+
+def main() -> int:
+    execute()
     return 0
 
 
@@ -18,9 +18,19 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Tuple
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - the minimal extractors below need no deps
+    yaml = None
 
 
 ROOT = Path(__file__).resolve().parents[1]  # .../contract/v1
@@ -28,9 +38,33 @@ POLICY_DIR = ROOT / "policy"
 TOOLS_DIR = ROOT / "tools"
 OUT_DIR = Path(__file__).resolve().parent / "outputs"
 
+# The orjson-or-stdlib rule is shared with the golden runner (contract/v1/golden/lib).
+sys.path.insert(0, str(ROOT / "golden"))
+from lib.canonical import orjson, orjson_bytes  # noqa: E402
+
+_ORJSON_COMPACT = orjson.OPT_SORT_KEYS if orjson is not None else 0
+_ORJSON_PRETTY = (orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2) if orjson is not None else 0
+
+# stdlib fallbacks, configured once rather than per json.dumps call.
+_COMPACT_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, sort_keys=True)
+
 
 def canonical_json_bytes(obj: Any) -> bytes:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    data = orjson_bytes(obj, _ORJSON_COMPACT)
+    if data is not None:
+        return data
+    return _COMPACT_ENCODER.encode(obj).encode("utf-8")
+
+
+def pretty_json_bytes(obj: Any) -> bytes:
+    """
+    Output file form: indent=2, sorted keys, UTF-8, no trailing newline.
+    """
+    data = orjson_bytes(obj, _ORJSON_PRETTY)
+    if data is not None:
+        return data
+    return _PRETTY_ENCODER.encode(obj).encode("utf-8")
 
 
 def sha256_hex(obj: Any) -> str:
@@ -50,88 +84,259 @@ def now_utc_from_arg(s: str | None) -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def extract_roles(yaml_text: str) -> List[str]:
-    roles: List[str] = []
-    for line in yaml_text.splitlines():
-        s = line.strip()
-        if s.startswith("- role_id:"):
-            roles.append(s.split(":", 1)[1].strip())
-    return roles
+# The minimal YAML extractors (no external deps) read the block-style subset the
+# policy files use: mappings nested by indentation, block sequences, and one-line
+# flow sequences/mappings. A key is only looked up at its own nesting level, so
+# e.g. denied_callers.roles or a tool's limits.enabled never stand in for
+# allowed_callers.roles or the tool's own enabled flag.
+_KEY_RE = re.compile(r"""([^\s#'"\[\]{},:-][^#:]*?|-[^\s#:][^#:]*?)[ \t]*:(?:[ \t]+(.*))?$""")
+
+# (inline value text, first child line, end line) of a key in a list of lines.
+_Node = Tuple[str, int, int]
+
+
+# Scalars are read the way YAML reads them, so the extractors and the PyYAML path
+# agree on quoted values and trailing comments: a quoted scalar is unquoted (with
+# JSON-style escapes for double quotes), a plain one loses any " #..." comment.
+_QUOTED_SCALAR_RE = re.compile(r"""[ \t]*(?:"((?:[^"\\]|\\.)*)"|'((?:[^']|'')*)')""")
+_PLAIN_COMMENT_RE = re.compile(r"(?:^|[ \t])#.*$")
+_FLOW_ITEM_RE = re.compile(r"""[ \t]*("(?:[^"\\]|\\.)*"|'(?:[^']|'')*'|[^,\]]*)[ \t]*([,\]])""")
+# Plain scalars PyYAML resolves to True (YAML 1.1 booleans).
+_YAML_TRUE = frozenset(("yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON"))
+
+
+def _scalar(raw: str) -> str:
+    return _scalar_quoted(raw)[0]
+
+
+def _scalar_quoted(raw: str) -> Tuple[str, bool]:
+    """(value, was_quoted) for the text after "key:" or "- "."""
+    m = _QUOTED_SCALAR_RE.match(raw)
+    if m is not None:
+        if m.group(1) is not None:
+            try:
+                return json.loads('"' + m.group(1) + '"'), True
+            except ValueError:
+                return m.group(1), True
+        return m.group(2).replace("''", "'"), True
+    return _PLAIN_COMMENT_RE.sub("", raw.strip()).strip(), False
+
+
+def _flow_items(line: str) -> List[str]:
+    """Items of a one-line flow sequence: 'roles: [A, "B", C]  # note'."""
+    body = line.split("[", 1)[1]
+    items: List[str] = []
+    pos = 0
+    while True:
+        m = _FLOW_ITEM_RE.match(body, pos)
+        if m is None:
+            break
+        item = _scalar(m.group(1))
+        if item or m.group(2) == ",":
+            items.append(item)
+        if m.group(2) == "]":
+            break
+        pos = m.end()
+    return items
+
+
+def _flow_split(body: str) -> List[str]:
+    """Top-level comma-separated parts of the inside of a one-line flow collection."""
+    parts: List[str] = []
+    depth = 0
+    quote = ""
+    start = 0
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if quote:
+            if c == "\\" and quote == '"':
+                i += 1
+            elif c == quote:
+                quote = ""
+        elif c in "\"'":
+            quote = c
+        elif c in "[{":
+            depth += 1
+        elif c in "]}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+        i += 1
+    parts.append(body[start:])
+    return [part for part in parts if part.strip()]
+
+
+def _yaml_lines(yaml_text: str) -> List[str]:
+    return [line.rstrip("\r") for line in yaml_text.lstrip("\ufeff").split("\n")]
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _is_content(line: str) -> bool:
+    text = line.strip()
+    return bool(text) and not text.startswith("#")
+
+
+def _is_item(line: str, indent: int) -> bool:
+    return line[indent:indent + 1] == "-" and line[indent + 1:indent + 2] in ("", " ", "\t")
+
+
+def _block_end(lines: List[str], i: int, indent: int, hi: int) -> int:
+    """End of the value nested under the key on lines[i] (a sequence may sit at the key's indent)."""
+    j = i + 1
+    while j < hi:
+        line = lines[j]
+        if _is_content(line):
+            ind = _indent(line)
+            if ind < indent or (ind == indent and not _is_item(line, ind)):
+                break
+        j += 1
+    return j
+
+
+def _joined_flow(lines: List[str], node: _Node, close: str) -> str:
+    """The flow collection starting at node's inline value, continued over its child lines if needed."""
+    value, lo, hi = node[0].strip(), node[1], node[2]
+    if close not in value:
+        value = " ".join([value] + [lines[j].strip() for j in range(lo, hi) if _is_content(lines[j])])
+    return value
+
+
+def _mapping(lines: List[str], lo: int, hi: int) -> Dict[str, _Node]:
+    """Keys of the block mapping in lines[lo:hi], at the indent of its first line."""
+    out: Dict[str, _Node] = {}
+    indent = -1
+    i = lo
+    while i < hi:
+        line = lines[i]
+        if not _is_content(line):
+            i += 1
+            continue
+        ind = _indent(line)
+        if indent < 0:
+            indent = ind
+        end = _block_end(lines, i, ind, hi)
+        m = _KEY_RE.match(line, ind) if ind == indent else None
+        if m is not None:
+            # Later duplicates win, as with the YAML loader.
+            out[m.group(1)] = (m.group(2) or "", i + 1, end)
+        i = end
+    return out
+
+
+def _node_mapping(lines: List[str], node: _Node | None) -> Dict[str, _Node]:
+    """The mapping a key's value holds (block or one-line flow); empty for anything else."""
+    if node is None:
+        return {}
+    if node[0].strip().startswith("{"):
+        body = _joined_flow(lines, node, "}")
+        out: Dict[str, _Node] = {}
+        for part in _flow_split(body[1:body.rfind("}")]):
+            key, sep, value = part.partition(":")
+            if sep:
+                out[_scalar(key)] = (value, 0, 0)
+        return out
+    if _scalar(node[0]):
+        return {}
+    return _mapping(lines, node[1], node[2])
+
+
+def _node_sequence(lines: List[str], node: _Node | None) -> List[str]:
+    """The scalar items a key's value holds (block or flow sequence); empty for anything else."""
+    if node is None:
+        return []
+    if node[0].strip().startswith("["):
+        return _flow_items(_joined_flow(lines, node, "]"))
+    if _scalar(node[0]):
+        return []
+    items: List[str] = []
+    indent = -1
+    for j in range(node[1], node[2]):
+        line = lines[j]
+        if not _is_content(line):
+            continue
+        ind = _indent(line)
+        if indent < 0:
+            indent = ind
+        if ind == indent and _is_item(line, ind):
+            items.append(_scalar(line[ind + 1:]))
+    return items
 
 
-def extract_lanes_allowed_roles(yaml_text: str) -> Dict[str, List[str]]:
+def _entries(lines: List[str], key: str) -> List[Dict[str, _Node]]:
     """
-    lane_id -> allowed_callers.roles list
-    (Minimal YAML pattern extraction; no external deps.)
+    The mappings listed under the top-level key (roles:, lanes:, tools:), one per
+    "- " item. Blanks out each item's dash in lines, so its keys line up.
     """
-    lanes: Dict[str, List[str]] = {}
-    current_lane: str | None = None
-    in_roles_list = False
-
-    for raw in yaml_text.splitlines():
-        line = raw.rstrip()
-
-        if line.strip().startswith("- lane_id:"):
-            current_lane = line.split(":", 1)[1].strip()
-            lanes[current_lane] = []
-            in_roles_list = False
+    top = _mapping(lines, 0, len(lines)).get(key)
+    if top is None or _scalar(top[0]):
+        return []
+    starts: List[int] = []
+    indent = -1
+    for j in range(top[1], top[2]):
+        line = lines[j]
+        if not _is_content(line):
             continue
+        ind = _indent(line)
+        if indent < 0:
+            indent = ind
+        if ind == indent and _is_item(line, ind):
+            starts.append(j)
+    entries: List[Dict[str, _Node]] = []
+    for start, end in zip(starts, starts[1:] + [top[2]]):
+        line = lines[start]
+        first = line[indent + 1:]
+        if first.strip().startswith("{"):
+            entries.append(_node_mapping(lines, (first, start + 1, end)))
+        else:
+            lines[start] = line[:indent] + " " + first
+            entries.append(_mapping(lines, start, end))
+    return entries
 
-        if current_lane is None:
-            continue
-
-        if line.strip().startswith("roles:"):
-            # roles: [A, B] OR multiline list
-            if "[" in line and "]" in line:
-                inside = line.split("[", 1)[1].split("]", 1)[0].strip()
-                lanes[current_lane] = [x.strip() for x in inside.split(",")] if inside else []
-                in_roles_list = False
-            else:
-                in_roles_list = True
-            continue
-
-        if in_roles_list:
-            s = line.strip()
-            if s.startswith("- "):
-                lanes[current_lane].append(s[2:].strip())
-            elif s and not s.startswith("-"):
-                in_roles_list = False
 
-    return lanes
+def extract_roles(yaml_text: str) -> List[str]:
+    return [_scalar(entry["role_id"][0]) for entry in _entries(_yaml_lines(yaml_text), "roles") if "role_id" in entry]
 
 
-def extract_lane_tools(yaml_text: str) -> Dict[str, List[str]]:
+def extract_lanes(yaml_text: str) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, FrozenSet[str]]]:
     """
-    lane_id -> allowed_actions.tools list
+    One pass over lanes.yaml:
+      lane_id -> allowed_callers.roles set
+      lane_id -> allowed_actions.tools set
+    (Minimal YAML extraction; no external deps.)
     """
-    lane_tools: Dict[str, List[str]] = {}
-    current_lane: str | None = None
-    in_tools = False
-
-    for raw in yaml_text.splitlines():
-        line = raw.rstrip()
+    lanes: Dict[str, FrozenSet[str]] = {}
+    lane_tools: Dict[str, FrozenSet[str]] = {}
 
-        if line.strip().startswith("- lane_id:"):
-            current_lane = line.split(":", 1)[1].strip()
-            lane_tools[current_lane] = []
-            in_tools = False
+    lines = _yaml_lines(yaml_text)
+    for lane in _entries(lines, "lanes"):
+        if "lane_id" not in lane:
             continue
+        lane_id = _scalar(lane["lane_id"][0])
+        callers = _node_mapping(lines, lane.get("allowed_callers"))
+        actions = _node_mapping(lines, lane.get("allowed_actions"))
+        lanes[lane_id] = frozenset(_node_sequence(lines, callers.get("roles")))
+        lane_tools[lane_id] = frozenset(_node_sequence(lines, actions.get("tools")))
 
-        if current_lane is None:
-            continue
+    return lanes, lane_tools
 
-        if line.strip() == "tools:":
-            in_tools = True
-            continue
 
-        if in_tools:
-            s = line.strip()
-            if s.startswith("- "):
-                lane_tools[current_lane].append(s[2:].strip())
-            elif s and not s.startswith("-"):
-                in_tools = False
+def extract_lanes_allowed_roles(yaml_text: str) -> Dict[str, FrozenSet[str]]:
+    """
+    lane_id -> allowed_callers.roles set
+    """
+    return extract_lanes(yaml_text)[0]
+
 
-    return lane_tools
+def extract_lane_tools(yaml_text: str) -> Dict[str, FrozenSet[str]]:
+    """
+    lane_id -> allowed_actions.tools set
+    """
+    return extract_lanes(yaml_text)[1]
 
 
 def extract_tool_registry(yaml_text: str) -> Dict[str, Dict[str, Any]]:
@@ -140,28 +345,121 @@ def extract_tool_registry(yaml_text: str) -> Dict[str, Dict[str, Any]]:
     Minimal extractor (no YAML dependency).
     """
     tools: Dict[str, Dict[str, Any]] = {}
-    current: str | None = None
 
-    for raw in yaml_text.splitlines():
-        s = raw.strip()
-
-        if s.startswith("- tool_name:"):
-            current = s.split(":", 1)[1].strip()
-            tools[current] = {"enabled": None, "implementation_status": None}
+    for entry in _entries(_yaml_lines(yaml_text), "tools"):
+        if "tool_name" not in entry:
             continue
+        enabled = None
+        if "enabled" in entry:
+            value, quoted = _scalar_quoted(entry["enabled"][0])
+            enabled = (not quoted and value in _YAML_TRUE) or value.lower() == "true"
+        impl = entry.get("implementation_status")
+        tools[_scalar(entry["tool_name"][0])] = {
+            "enabled": enabled,
+            "implementation_status": None if impl is None else _scalar(impl[0]),
+        }
 
-        if current is None:
-            continue
+    return tools
 
-        if s.startswith("enabled:"):
-            val = s.split(":", 1)[1].strip().lower()
-            tools[current]["enabled"] = (val == "true")
-            continue
 
-        if s.startswith("implementation_status:"):
-            tools[current]["implementation_status"] = s.split(":", 1)[1].strip()
-            continue
+# Only libyaml's loader is worth it: the pure-Python SafeLoader is much slower than
+# the extractors above, so without libyaml the extractors are used instead.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) if yaml is not None else None
+
 
+class _NotPlain(Exception):
+    """A value the extractors would read differently (not a plain string)."""
+
+
+def _load_yaml(yaml_text: str) -> Any:
+    """
+    Parsed document, or None when libyaml is unavailable or rejects the text
+    (callers then fall back to the minimal extractors above).
+    """
+    if _YAML_LOADER is None:
+        return None
+    try:
+        return yaml.load(yaml_text, Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+
+
+def _yaml_list(doc: Any, key: str) -> List[Dict[str, Any]] | None:
+    items = doc.get(key) if isinstance(doc, dict) else None
+    if not isinstance(items, list):
+        return None
+    return [item for item in items if isinstance(item, dict)]
+
+
+def _str(value: Any) -> str:
+    # Numbers, booleans, nulls, nested mappings... are spelled differently (or are
+    # unhashable) once parsed; such files are read by the extractors instead, so the
+    # outcome never depends on whether PyYAML is installed.
+    if not isinstance(value, str):
+        raise _NotPlain
+    return value
+
+
+def _str_set(container: Any, key: str) -> FrozenSet[str]:
+    if container is None:
+        return frozenset()
+    if not isinstance(container, dict):
+        raise _NotPlain
+    values = container.get(key)
+    if values is None:
+        return frozenset()
+    if not isinstance(values, list):
+        raise _NotPlain
+    return frozenset(_str(v) for v in values)
+
+
+def load_roles(yaml_text: str) -> List[str]:
+    roles = _yaml_list(_load_yaml(yaml_text), "roles")
+    if roles is None:
+        return extract_roles(yaml_text)
+    try:
+        return [_str(r["role_id"]) for r in roles if "role_id" in r]
+    except _NotPlain:
+        return extract_roles(yaml_text)
+
+
+def load_lanes(yaml_text: str) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, FrozenSet[str]]]:
+    lanes = _yaml_list(_load_yaml(yaml_text), "lanes")
+    if lanes is None:
+        return extract_lanes(yaml_text)
+    allowed: Dict[str, FrozenSet[str]] = {}
+    tools: Dict[str, FrozenSet[str]] = {}
+    try:
+        for lane in lanes:
+            if "lane_id" not in lane:
+                continue
+            lane_id = _str(lane["lane_id"])
+            allowed[lane_id] = _str_set(lane.get("allowed_callers"), "roles")
+            tools[lane_id] = _str_set(lane.get("allowed_actions"), "tools")
+    except _NotPlain:
+        return extract_lanes(yaml_text)
+    return allowed, tools
+
+
+def load_tool_registry(yaml_text: str) -> Dict[str, Dict[str, Any]]:
+    entries = _yaml_list(_load_yaml(yaml_text), "tools")
+    if entries is None:
+        return extract_tool_registry(yaml_text)
+    tools: Dict[str, Dict[str, Any]] = {}
+    try:
+        for entry in entries:
+            if "tool_name" not in entry:
+                continue
+            enabled = entry.get("enabled")
+            if "enabled" in entry and not isinstance(enabled, bool):
+                _str(enabled)
+            impl = entry.get("implementation_status")
+            tools[_str(entry["tool_name"])] = {
+                "enabled": None if "enabled" not in entry else str(enabled).lower() == "true",
+                "implementation_status": None if "implementation_status" not in entry else _str(impl),
+            }
+    except _NotPlain:
+        return extract_tool_registry(yaml_text)
     return tools
 
 
@@ -205,6 +503,101 @@ def build_run_record(
     }
 
 
+# Every audit event key, with the values that never vary between events. The
+# mutable fields (target_json, *_artifacts_json, metadata_json) are None here and
+# are given a fresh object per event, so events never share containers.
+_EVENT_SKELETON: Mapping[str, Any] = MappingProxyType(
+    {
+        "event_id": None,
+        "timestamp_utc": None,
+        "action_type": None,
+        "outcome": None,
+        "outcome_reason_bounded": None,
+        "contract_version": "v1",
+        "policy_versions_lanes": None,
+        "policy_versions_roles": None,
+        "case_id": None,
+        "lane_id": None,
+        "run_id": None,
+        "parent_run_id": None,
+        "root_run_id": None,
+        "actor_type": "agent",
+        "actor_id": "harness_actor",
+        "role_id": None,
+        "target_json": None,
+        "request_hash_sha256": None,
+        "response_hash_sha256": None,
+        "input_artifacts_json": None,
+        "output_artifacts_json": None,
+        "error_code": None,
+        "error_message_bounded": None,
+        "retryable": None,
+        "metadata_json": None,
+    }
+)
+
+
+def event_factory(
+    *,
+    ts: str,
+    run_id: str,
+    lane_id: str | None,
+    case_id: str | None,
+    role_id: str | None,
+    policy_versions: Tuple[str, str] = ("v1", "v1"),
+) -> Callable[..., Dict[str, Any]]:
+    """
+    Audit event builder for one run: _EVENT_SKELETON plus the fields shared by
+    every event of the run are laid out once in a template, and each event is a
+    copy of it plus the per-event fields.
+    """
+    lanes_ver, roles_ver = policy_versions
+    template = dict(_EVENT_SKELETON)
+    template["timestamp_utc"] = ts
+    template["policy_versions_lanes"] = lanes_ver
+    template["policy_versions_roles"] = roles_ver
+    template["case_id"] = case_id
+    template["lane_id"] = lane_id
+    template["run_id"] = run_id
+    template["root_run_id"] = run_id
+    template["role_id"] = role_id
+
+    def make(
+        *,
+        event_id: str,
+        action_type: str,
+        outcome: str,
+        tool_name: str | None = None,
+        request_obj: Any | None = None,
+        request_hash: str | None = None,
+        response_obj: Any | None = None,
+        outcome_reason: str | None = None,
+        error_code: str | None = None,
+        error_message: str | None = None,
+        retryable: bool | None = None,
+    ) -> Dict[str, Any]:
+        # request_hash: precomputed sha256_hex(request_obj), for callers that hash the same request repeatedly.
+        if request_hash is None and request_obj is not None:
+            request_hash = sha256_hex(request_obj)
+        event = template.copy()
+        event["event_id"] = event_id
+        event["action_type"] = action_type
+        event["outcome"] = outcome
+        event["outcome_reason_bounded"] = outcome_reason
+        event["target_json"] = {}
+        event["request_hash_sha256"] = request_hash
+        event["response_hash_sha256"] = sha256_hex(response_obj) if response_obj is not None else None
+        event["input_artifacts_json"] = []
+        event["output_artifacts_json"] = []
+        event["error_code"] = error_code
+        event["error_message_bounded"] = error_message
+        event["retryable"] = retryable
+        event["metadata_json"] = {"tool_name": tool_name} if tool_name else {}
+        return event
+
+    return make
+
+
 def audit_event(
     *,
     event_id: str,
@@ -215,43 +608,50 @@ def audit_event(
     lane_id: str | None,
     case_id: str | None,
     role_id: str | None,
-    tool_name: str | None = None,
     policy_versions: Tuple[str, str] = ("v1", "v1"),
-    request_obj: Any | None = None,
-    response_obj: Any | None = None,
-    outcome_reason: str | None = None,
-    error_code: str | None = None,
-    error_message: str | None = None,
-    retryable: bool | None = None,
+    **fields: Any,
 ) -> Dict[str, Any]:
-    lanes_ver, roles_ver = policy_versions
-    return {
-        "event_id": event_id,
-        "timestamp_utc": ts,
-        "action_type": action_type,
-        "outcome": outcome,
-        "outcome_reason_bounded": outcome_reason,
-        "contract_version": "v1",
-        "policy_versions_lanes": lanes_ver,
-        "policy_versions_roles": roles_ver,
-        "case_id": case_id,
-        "lane_id": lane_id,
-        "run_id": run_id,
-        "parent_run_id": None,
-        "root_run_id": run_id,
-        "actor_type": "agent",
-        "actor_id": "harness_actor",
-        "role_id": role_id,
-        "target_json": {},
-        "request_hash_sha256": sha256_hex(request_obj) if request_obj is not None else None,
-        "response_hash_sha256": sha256_hex(response_obj) if response_obj is not None else None,
-        "input_artifacts_json": [],
-        "output_artifacts_json": [],
-        "error_code": error_code,
-        "error_message_bounded": error_message,
-        "retryable": retryable,
-        "metadata_json": {"tool_name": tool_name} if tool_name else {},
-    }
+    """
+    Single event; see event_factory for the optional per-event fields.
+    """
+    make = event_factory(
+        ts=ts, run_id=run_id, lane_id=lane_id, case_id=case_id, role_id=role_id, policy_versions=policy_versions
+    )
+    return make(event_id=event_id, action_type=action_type, outcome=outcome, **fields)
+
+
+class AuditLedgerWriter:
+    """
+    Writes audit_ledger.json incrementally as events are produced.
+    Bytes match pretty_json_bytes(events) for the full list; the file is written
+    to a sibling .tmp and moved into place on a clean exit.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._tmp = path.with_name(path.name + ".tmp")
+        self._f = None
+        self._count = 0
+
+    def __enter__(self) -> "AuditLedgerWriter":
+        self._f = self._tmp.open("wb")
+        return self
+
+    def append(self, event: Dict[str, Any]) -> None:
+        # Each event is one level deep in the array; JSON strings never hold a raw
+        # newline, so re-indenting is a plain replace.
+        self._f.write(b"[\n  " if self._count == 0 else b",\n  ")
+        self._f.write(pretty_json_bytes(event).replace(b"\n", b"\n  "))
+        self._count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self._f.write(b"\n]" if self._count else b"[]")
+        self._f.close()
+        if exc_type is None:
+            os.replace(self._tmp, self.path)
+        else:
+            self._tmp.unlink(missing_ok=True)
 
 
 def main() -> int:
@@ -263,23 +663,26 @@ def main() -> int:
     ap.add_argument("--policy_roles_version", default="v1")
     args = ap.parse_args()
 
-    request_path = Path(args.request)
-    request = json.loads(request_path.read_text(encoding="utf-8"))
+    # The three policy files are independent of the request; read them while it is parsed and hashed.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        roles_fut = ex.submit(read_text_utf8, POLICY_DIR / "roles.yaml")
+        lanes_fut = ex.submit(read_text_utf8, POLICY_DIR / "lanes.yaml")
+        tools_fut = ex.submit(read_text_utf8, TOOLS_DIR / "tool_registry.yaml")
 
-    now_utc = now_utc_from_arg(args.now_utc)
-    policy_versions = (args.policy_lanes_version, args.policy_roles_version)
+        request_path = Path(args.request)
+        request = json.loads(request_path.read_text(encoding="utf-8"))
 
-    req_hash = sha256_hex(request)
-    run_id = args.run_id or f"RUN_{req_hash[:12]}"
+        now_utc = now_utc_from_arg(args.now_utc)
+        policy_versions = (args.policy_lanes_version, args.policy_roles_version)
 
-    roles_txt = read_text_utf8(POLICY_DIR / "roles.yaml")
-    lanes_txt = read_text_utf8(POLICY_DIR / "lanes.yaml")
-    tools_txt = read_text_utf8(TOOLS_DIR / "tool_registry.yaml")
+        req_hash = sha256_hex(request)
+        run_id = args.run_id or f"RUN_{req_hash[:12]}"
 
-    roles = set(extract_roles(roles_txt))
-    lanes_allowed = extract_lanes_allowed_roles(lanes_txt)
-    lane_tools = extract_lane_tools(lanes_txt)
-    tool_registry = extract_tool_registry(tools_txt)
+        roles_txt, lanes_txt, tools_txt = roles_fut.result(), lanes_fut.result(), tools_fut.result()
+
+    roles = set(load_roles(roles_txt))
+    lanes_allowed, lane_tools = load_lanes(lanes_txt)
+    tool_registry = load_tool_registry(tools_txt)
 
     role_id = request.get("agent_role")
     lane_id = request.get("lane_id")
@@ -289,207 +692,161 @@ def main() -> int:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     run_record = build_run_record(run_id, request, now_utc, policy_versions)
-    events: List[Dict[str, Any]] = []
-
-    # 1) run_created
-    events.append(
-        audit_event(
-            event_id=f"EVT_{run_id}_001",
-            ts=now_utc,
-            action_type="run_created",
-            outcome="success",
-            run_id=run_id,
-            lane_id=lane_id,
-            case_id=case_id,
-            role_id=role_id,
-            policy_versions=policy_versions,
-            request_obj={"run_record": run_record},
-            response_obj={"created": True},
-        )
+    make_event = event_factory(
+        ts=now_utc, run_id=run_id, lane_id=lane_id, case_id=case_id, role_id=role_id, policy_versions=policy_versions
     )
 
-    # 2) lane_authorized
-    lane_ok = True
-    lane_reason = None
-
-    if role_id not in roles:
-        lane_ok = False
-        lane_reason = "role_not_defined"
-    elif lane_id not in lanes_allowed:
-        lane_ok = False
-        lane_reason = "lane_not_defined"
-    elif role_id not in lanes_allowed.get(lane_id, []):
-        lane_ok = False
-        lane_reason = "role_not_allowed_for_lane"
-
-    events.append(
-        audit_event(
-            event_id=f"EVT_{run_id}_002",
-            ts=now_utc,
-            action_type="lane_authorized",
-            outcome="success" if lane_ok else "denied",
-            outcome_reason=lane_reason,
-            run_id=run_id,
-            lane_id=lane_id,
-            case_id=case_id,
-            role_id=role_id,
-            policy_versions=policy_versions,
-            request_obj={"role_id": role_id, "lane_id": lane_id},
-            response_obj={"authorized": lane_ok, "reason": lane_reason},
+    with AuditLedgerWriter(OUT_DIR / "audit_ledger.json") as ledger:
+        # 1) run_created
+        ledger.append(
+            make_event(
+                event_id=f"EVT_{run_id}_001",
+                action_type="run_created",
+                outcome="success",
+                request_obj={"run_record": run_record},
+                response_obj={"created": True},
+            )
         )
-    )
 
-    # 3) tool_requested (always recorded)
-    events.append(
-        audit_event(
-            event_id=f"EVT_{run_id}_003",
-            ts=now_utc,
-            action_type="tool_requested",
-            outcome="success",
-            run_id=run_id,
-            lane_id=lane_id,
-            case_id=case_id,
-            role_id=role_id,
-            tool_name=tool_name,
-            policy_versions=policy_versions,
-            request_obj=request,
-            response_obj={"received": True},
+        # 2) lane_authorized
+        lane_ok = True
+        lane_reason = None
+
+        if role_id not in roles:
+            lane_ok = False
+            lane_reason = "role_not_defined"
+        elif lane_id not in lanes_allowed:
+            lane_ok = False
+            lane_reason = "lane_not_defined"
+        elif role_id not in lanes_allowed.get(lane_id, ()):
+            lane_ok = False
+            lane_reason = "role_not_allowed_for_lane"
+
+        ledger.append(
+            make_event(
+                event_id=f"EVT_{run_id}_002",
+                action_type="lane_authorized",
+                outcome="success" if lane_ok else "denied",
+                outcome_reason=lane_reason,
+                request_obj={"role_id": role_id, "lane_id": lane_id},
+                response_obj={"authorized": lane_ok, "reason": lane_reason},
+            )
         )
-    )
 
-    # 4) tool_allowed (policy + registry check)
-    allowed = True
-    deny_reason = None
-
-    if not lane_ok:
-        allowed = False
-        deny_reason = "lane_not_authorized"
-    elif tool_name not in tool_registry:
-        allowed = False
-        deny_reason = "tool_not_registered"
-    elif tool_name not in lane_tools.get(lane_id, []):
-        allowed = False
-        deny_reason = "tool_not_allowed_in_lane"
-    else:
-        enabled = tool_registry[tool_name].get("enabled")
-        impl = tool_registry[tool_name].get("implementation_status")
-        if enabled is False:
-            allowed = False
-            deny_reason = "tool_disabled"
-        elif impl != "implemented":
-            allowed = False
-            deny_reason = "tool_not_implemented"
-
-    events.append(
-        audit_event(
-            event_id=f"EVT_{run_id}_004",
-            ts=now_utc,
-            action_type="tool_allowed",
-            outcome="success" if allowed else "denied",
-            outcome_reason=deny_reason,
-            run_id=run_id,
-            lane_id=lane_id,
-            case_id=case_id,
-            role_id=role_id,
-            tool_name=tool_name,
-            policy_versions=policy_versions,
-            request_obj={"tool_name": tool_name, "lane_id": lane_id},
-            response_obj={"allowed": allowed, "reason": deny_reason},
+        # 3) tool_requested (always recorded)
+        ledger.append(
+            make_event(
+                event_id=f"EVT_{run_id}_003",
+                action_type="tool_requested",
+                outcome="success",
+                tool_name=tool_name,
+                request_hash=req_hash,
+                response_obj={"received": True},
+            )
         )
-    )
 
-    # 5) tool_denied OR tool_executed (v1 default: denied)
-    if not allowed:
-        denial_response = {
-            "status": "denied",
-            "error_code": "TOOL_DENIED",
-            "diagnostic": {
-                "category": "policy",
-                "message": "Tool execution denied by Tool Gateway policy.",
-                "likely_cause": deny_reason,
-                "suggested_fix": "Enable and implement tool OR adjust lane permissions under attorney-approved contract change.",
-                "retryable": False,
-                "severity": "high",
-            },
-        }
+        # 4) tool_allowed (policy + registry check)
+        allowed = True
+        deny_reason = None
 
-        events.append(
-            audit_event(
-                event_id=f"EVT_{run_id}_005",
-                ts=now_utc,
-                action_type="tool_denied",
-                outcome="denied",
+        if not lane_ok:
+            allowed = False
+            deny_reason = "lane_not_authorized"
+        elif tool_name not in tool_registry:
+            allowed = False
+            deny_reason = "tool_not_registered"
+        elif tool_name not in lane_tools.get(lane_id, ()):
+            allowed = False
+            deny_reason = "tool_not_allowed_in_lane"
+        else:
+            enabled = tool_registry[tool_name].get("enabled")
+            impl = tool_registry[tool_name].get("implementation_status")
+            if enabled is False:
+                allowed = False
+                deny_reason = "tool_disabled"
+            elif impl != "implemented":
+                allowed = False
+                deny_reason = "tool_not_implemented"
+
+        ledger.append(
+            make_event(
+                event_id=f"EVT_{run_id}_004",
+                action_type="tool_allowed",
+                outcome="success" if allowed else "denied",
                 outcome_reason=deny_reason,
-                run_id=run_id,
-                lane_id=lane_id,
-                case_id=case_id,
-                role_id=role_id,
                 tool_name=tool_name,
-                policy_versions=policy_versions,
-                request_obj=request,
-                response_obj=denial_response,
-                error_code="TOOL_DENIED",
-                error_message=f"Denied: {deny_reason}",
-                retryable=False,
+                request_obj={"tool_name": tool_name, "lane_id": lane_id},
+                response_obj={"allowed": allowed, "reason": deny_reason},
             )
         )
 
-        run_record["status"] = "completed"
-        run_record["completed_at_utc"] = now_utc
-    else:
-        # reserved for future when tools become enabled+implemented
-        run_record["status"] = "failed"
-        run_record["completed_at_utc"] = now_utc
-        run_record["error_code"] = "TOOL_NOT_IMPLEMENTED"
-        run_record["error_message_bounded"] = "Harness does not execute tools."
-
-        events.append(
-            audit_event(
-                event_id=f"EVT_{run_id}_005",
-                ts=now_utc,
-                action_type="tool_executed",
-                outcome="failed",
-                outcome_reason="harness_no_execution",
-                run_id=run_id,
-                lane_id=lane_id,
-                case_id=case_id,
-                role_id=role_id,
-                tool_name=tool_name,
-                policy_versions=policy_versions,
-                request_obj=request,
-                response_obj={"status": "failed", "error_code": "TOOL_NOT_IMPLEMENTED"},
-                error_code="TOOL_NOT_IMPLEMENTED",
-                error_message="Harness does not execute tools.",
-                retryable=False,
+        # 5) tool_denied OR tool_executed (v1 default: denied)
+        if not allowed:
+            denial_response = {
+                "status": "denied",
+                "error_code": "TOOL_DENIED",
+                "diagnostic": {
+                    "category": "policy",
+                    "message": "Tool execution denied by Tool Gateway policy.",
+                    "likely_cause": deny_reason,
+                    "suggested_fix": "Enable and implement tool OR adjust lane permissions under attorney-approved contract change.",
+                    "retryable": False,
+                    "severity": "high",
+                },
+            }
+
+            ledger.append(
+                make_event(
+                    event_id=f"EVT_{run_id}_005",
+                    action_type="tool_denied",
+                    outcome="denied",
+                    outcome_reason=deny_reason,
+                    tool_name=tool_name,
+                    request_hash=req_hash,
+                    response_obj=denial_response,
+                    error_code="TOOL_DENIED",
+                    error_message=f"Denied: {deny_reason}",
+                    retryable=False,
+                )
             )
-        )
 
-    # 6) run_completed
-    events.append(
-        audit_event(
-            event_id=f"EVT_{run_id}_006",
-            ts=now_utc,
-            action_type="run_completed",
-            outcome="success" if run_record["status"] == "completed" else "failed",
-            outcome_reason="completed" if run_record["status"] == "completed" else "failed",
-            run_id=run_id,
-            lane_id=lane_id,
-            case_id=case_id,
-            role_id=role_id,
-            policy_versions=policy_versions,
-            request_obj={"final_status": run_record["status"]},
-            response_obj={"completed": True, "status": run_record["status"]},
+            run_record["status"] = "completed"
+            run_record["completed_at_utc"] = now_utc
+        else:
+            # reserved for future when tools become enabled+implemented
+            run_record["status"] = "failed"
+            run_record["completed_at_utc"] = now_utc
+            run_record["error_code"] = "TOOL_NOT_IMPLEMENTED"
+            run_record["error_message_bounded"] = "Harness does not execute tools."
+
+            ledger.append(
+                make_event(
+                    event_id=f"EVT_{run_id}_005",
+                    action_type="tool_executed",
+                    outcome="failed",
+                    outcome_reason="harness_no_execution",
+                    tool_name=tool_name,
+                    request_hash=req_hash,
+                    response_obj={"status": "failed", "error_code": "TOOL_NOT_IMPLEMENTED"},
+                    error_code="TOOL_NOT_IMPLEMENTED",
+                    error_message="Harness does not execute tools.",
+                    retryable=False,
+                )
+            )
+
+        # 6) run_completed
+        ledger.append(
+            make_event(
+                event_id=f"EVT_{run_id}_006",
+                action_type="run_completed",
+                outcome="success" if run_record["status"] == "completed" else "failed",
+                outcome_reason="completed" if run_record["status"] == "completed" else "failed",
+                request_obj={"final_status": run_record["status"]},
+                response_obj={"completed": True, "status": run_record["status"]},
+            )
         )
-    )
 
-    (OUT_DIR / "run_record.json").write_text(
-        json.dumps(run_record, indent=2, ensure_ascii=False, sort_keys=True),
-        encoding="utf-8",
-    )
-    (OUT_DIR / "audit_ledger.json").write_text(
-        json.dumps(events, indent=2, ensure_ascii=False, sort_keys=True),
-        encoding="utf-8",
-    )
+    (OUT_DIR / "run_record.json").write_bytes(pretty_json_bytes(run_record))
 
     print("OK: wrote contract/v1/harness/outputs/run_record.json and audit_ledger.json")
     print(f"run_id={run_id}")
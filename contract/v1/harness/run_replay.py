@@ -15,38 +15,175 @@ Contract constraints:
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
+import mmap
 import os
+import stat
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dep, only needed for --hash_algo xxh3
+    xxhash = None
+
+# File fingerprints share the golden runner's memo (contract/v1/golden/lib).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "golden"))
+from lib.canonical import memoized_file_digest  # noqa: E402
 
 
 SCHEMA_VERSION = "replay_equivalence_v1"
+# Non-sha256 fingerprints and manifest digests are not comparable with v1 outputs,
+# so they use their own schema.
+SCHEMA_VERSION_V2 = "replay_equivalence_v2"
+
+HASH_ALGO_SHA256 = "sha256"
+HASH_ALGO_XXH3 = "xxh3"
+HASH_ALGO_BLAKE2B = "blake2b"
+
+# Value of the "hash_algo" field of v2 outputs.
+HASH_ALGO_LABELS: Dict[str, str] = {
+    HASH_ALGO_SHA256: "sha256",
+    HASH_ALGO_XXH3: "xxh3_128",
+    HASH_ALGO_BLAKE2B: "blake2b_256",
+}
+
+
+def new_hasher(hash_algo: str = HASH_ALGO_SHA256) -> Any:
+    if hash_algo == HASH_ALGO_XXH3:
+        if xxhash is None:
+            raise RuntimeError("--hash_algo xxh3 requires the optional 'xxhash' package.")
+        return xxhash.xxh3_128()
+    if hash_algo == HASH_ALGO_BLAKE2B:
+        # 256-bit output, same width as sha256.
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.sha256()
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
+    return _hash_file(path, new_hasher(HASH_ALGO_SHA256))
+
+
+def xxh3_file(path: Path) -> str:
+    return _hash_file(path, new_hasher(HASH_ALGO_XXH3))
+
+
+def blake2b_file(path: Path) -> str:
+    return _hash_file(path, new_hasher(HASH_ALGO_BLAKE2B))
+
+
+def _hash_file(path: Path, h: Any) -> str:
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+        _update_from_file(f, h)
     return h.hexdigest()
 
 
+def _update_from_file(f: Any, h: Any) -> int:
+    """
+    Feed the whole of the open binary file f to h without loading it into a bytes
+    object. Returns the number of bytes fed.
+    """
+    # Empty files cannot be mapped, and pseudo-files (e.g. /proc) report size 0
+    # while still having content, so both take the streaming path below.
+    if os.fstat(f.fileno()).st_size > 0:
+        try:
+            # Map the file and hash it in one C-level update (the buffer is not copied).
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+                return len(mm)
+        except (OSError, ValueError, OverflowError):
+            # Not mappable (special file, > address space on 32-bit): stream instead.
+            pass
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: readinto a reused buffer, no per-chunk bytes objects.
+        hashlib.file_digest(f, lambda: h)
+        return f.tell()
+    n = 0
+    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+        h.update(chunk)
+        n += len(chunk)
+    return n
+
+
+FINGERPRINTERS: Dict[str, Callable[[Path], str]] = {
+    HASH_ALGO_SHA256: sha256_file,
+    HASH_ALGO_XXH3: xxh3_file,
+    HASH_ALGO_BLAKE2B: blake2b_file,
+}
+
+
+def fingerprint_bytes(data: bytes, hash_algo: str = HASH_ALGO_SHA256) -> str:
+    h = new_hasher(hash_algo)
+    h.update(data)
+    return h.hexdigest()
+
+
+def manifest_digest(entries: List[Tuple[str, Path]], hash_algo: str = HASH_ALGO_SHA256) -> str:
+    """
+    One digest over (relpath, contents) of every entry, in relpath order, through a
+    single hash context. Each relpath and each file body is length-prefixed (8-byte
+    big-endian), so distinct manifests can never produce the same byte stream.
+    """
+    h = new_hasher(hash_algo)
+    for rel, p in sorted(entries, key=lambda e: e[0]):
+        rel_b = rel.encode("utf-8")
+        h.update(struct.pack(">Q", len(rel_b)))
+        h.update(rel_b)
+        with p.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > 0:
+                # Stream the body (same path as per-file fingerprints) behind its size.
+                h.update(struct.pack(">Q", size))
+                if _update_from_file(f, h) != size:
+                    raise RuntimeError(f"{rel} changed size while it was being hashed")
+            else:
+                # Empty, or a pseudo-file whose real length is only known once read.
+                body = f.read()
+                h.update(struct.pack(">Q", len(body)))
+                h.update(body)
+    return h.hexdigest()
+
+
+def fingerprint_file(path: Path, hash_algo: str = HASH_ALGO_SHA256) -> str:
+    """
+    Fingerprint of path, memoized per process (lib.canonical.memoized_file_digest:
+    keyed on algo, path, inode, mtime_ns and size, skipping files modified within
+    the racy window) so artifacts shared by several vectors are hashed once.
+    """
+    return memoized_file_digest(path, hash_algo, FINGERPRINTERS[hash_algo])
+
+
 def stable_json_dumps(obj: Any) -> str:
     # Deterministic JSON formatting
     return json.dumps(obj, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
 
 
+def canonical_json_bytes(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
 def load_json(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def load_json_and_hash(path: Path, hash_algo: str = HASH_ALGO_SHA256) -> Tuple[Any, str]:
+    """
+    Parsed JSON and fingerprint_file(path, hash_algo), from a single read of the file.
+    """
+    raw = path.read_bytes()
+    return json.loads(raw.decode("utf-8")), fingerprint_bytes(raw, hash_algo)
+
+
 def write_json(path: Path, obj: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="\n") as f:
-        f.write(stable_json_dumps(obj))
+    # Encode once and write bytes: no text-layer newline translation or re-encoding.
+    path.write_bytes(stable_json_dumps(obj).encode("utf-8"))
 
 
 def normalize_relpath(p: Path) -> str:
@@ -54,6 +191,26 @@ def normalize_relpath(p: Path) -> str:
     return str(p).replace("\\", "/")
 
 
+def _fast_relpath(p: Path, root_prefix: str) -> str:
+    """
+    normalize_relpath(p.relative_to(root)), where root_prefix is str(root) + os.sep.
+    Slices the path string instead of building an intermediate Path; anything not
+    under root_prefix goes through relative_to (and raises as before).
+    """
+    s = str(p)
+    if s.startswith(root_prefix):
+        return s[len(root_prefix):].replace("\\", "/")
+    return normalize_relpath(p.relative_to(root_prefix.rstrip(os.sep) or os.sep))
+
+
+def _is_file(p: Path) -> bool:
+    # p.exists() and p.is_file() in a single stat call.
+    try:
+        return stat.S_ISREG(os.stat(p).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
 def default_artifact_paths(contract_root: Path) -> List[Path]:
     """
     A conservative default set. These are expected to exist in your repo based
@@ -82,28 +239,70 @@ def vector_artifact_paths(vector: Dict[str, Any], contract_root: Path) -> List[P
     return [contract_root / Path(p) for p in include_paths]
 
 
-def compute_outputs(vector_path: Path, contract_root: Path, vector: Dict[str, Any]) -> Dict[str, Any]:
+_HASH_POOL: ThreadPoolExecutor | None = None
+
+
+def _hash_pool() -> ThreadPoolExecutor:
+    # One pool for the whole process, reused across vectors.
+    global _HASH_POOL
+    if _HASH_POOL is None:
+        _HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="replay-hash")
+    return _HASH_POOL
+
+
+def compute_outputs(
+    vector_path: Path,
+    contract_root: Path,
+    vector: Dict[str, Any],
+    hash_algo: str = HASH_ALGO_SHA256,
+    vector_fingerprint: str | None = None,
+    manifest: bool = False,
+) -> Dict[str, Any]:
+    """
+    vector_fingerprint: fingerprint of vector_path already computed by the caller
+    (see load_json_and_hash); hashed here when omitted.
+    manifest: emit one manifest_digest over all artifacts instead of per-file fingerprints.
+    """
     artifacts = vector_artifact_paths(vector, contract_root)
+    fingerprint = functools.partial(fingerprint_file, hash_algo=hash_algo)
 
-    fingerprints: Dict[str, str] = {}
     missing: List[str] = []
+    present: List[Tuple[str, Path]] = []
+    root_prefix = os.path.join(str(contract_root), "")
 
     for p in artifacts:
-        if not p.exists() or not p.is_file():
-            missing.append(normalize_relpath(p.relative_to(contract_root)))
+        rel = _fast_relpath(p, root_prefix)
+        if not _is_file(p):
+            missing.append(rel)
             continue
-        rel = normalize_relpath(p.relative_to(contract_root))
-        fingerprints[rel] = sha256_file(p)
-
-    # Include the vector itself to prevent silent vector mutation.
-    fingerprints[normalize_relpath(vector_path.relative_to(contract_root.parent.parent))] = sha256_file(vector_path)
+        present.append((rel, p))
 
+    vector_rel = _fast_relpath(vector_path, os.path.join(str(contract_root.parent.parent), ""))
     outputs: Dict[str, Any] = {
         "schema_version": SCHEMA_VERSION,
         "vector_id": vector.get("id") or vector_path.stem,
-        "fingerprints": dict(sorted(fingerprints.items(), key=lambda kv: kv[0])),
-        "missing_artifacts": sorted(missing),
     }
+
+    if manifest:
+        # Vector included, as in the per-file form, to prevent silent vector mutation.
+        entries = dict(present)
+        entries[vector_rel] = vector_path
+        outputs["manifest_digest"] = manifest_digest(list(entries.items()), hash_algo)
+    else:
+        # Artifacts are independent and hashing releases the GIL, so fingerprint them concurrently.
+        digests = _hash_pool().map(fingerprint, [p for _, p in present])
+        fingerprints: Dict[str, str] = dict(zip((rel for rel, _ in present), digests))
+
+        # Include the vector itself to prevent silent vector mutation.
+        if vector_fingerprint is None:
+            vector_fingerprint = fingerprint(vector_path)
+        fingerprints[vector_rel] = vector_fingerprint
+        outputs["fingerprints"] = dict(sorted(fingerprints.items(), key=lambda kv: kv[0]))
+
+    outputs["missing_artifacts"] = sorted(missing)
+    if manifest or hash_algo != HASH_ALGO_SHA256:
+        outputs["schema_version"] = SCHEMA_VERSION_V2
+        outputs["hash_algo"] = HASH_ALGO_LABELS[hash_algo]
     return outputs
 
 
@@ -113,9 +312,15 @@ def diff_expected(computed: Dict[str, Any], expected: Dict[str, Any]) -> List[st
     We require exact match of:
       - schema_version
       - vector_id
-      - fingerprints (keys + values)
+      - fingerprints (keys + values), or manifest_digest
       - missing_artifacts (must be empty ideally, but compared exactly)
     """
+    # Fast path for the common case: identical documents serialize to identical bytes.
+    # Any byte difference (including fields not compared below) falls through to the
+    # field-by-field comparison, which decides the result.
+    if canonical_json_bytes(computed) == canonical_json_bytes(expected):
+        return []
+
     diffs: List[str] = []
 
     def cmp(key: str) -> None:
@@ -123,9 +328,11 @@ def diff_expected(computed: Dict[str, Any], expected: Dict[str, Any]) -> List[st
             diffs.append(f"Mismatch at '{key}': computed != expected")
 
     cmp("schema_version")
+    cmp("hash_algo")
     cmp("vector_id")
     cmp("missing_artifacts")
     cmp("fingerprints")
+    cmp("manifest_digest")
 
     return diffs
 
@@ -135,12 +342,15 @@ def discover_vectors(vectors_dir: Path) -> List[Path]:
     #   <name>.json            = vector input
     #   <name>.expected.json   = canonical expected outputs
     # We treat files ending in ".expected.json" as expected files, not vectors.
-    vectors = []
-    for p in sorted(vectors_dir.glob("*.json")):
-        if p.name.endswith(".expected.json"):
-            continue
-        vectors.append(p)
-    return vectors
+    # One scandir pass; names are matched as glob("*.json") would (case-insensitively on Windows).
+    names = []
+    with os.scandir(vectors_dir) as it:
+        for entry in it:
+            name = os.path.normcase(entry.name)
+            if name.endswith(".json") and not name.endswith(".expected.json") and entry.is_file():
+                names.append(entry.name)
+    names.sort(key=os.path.normcase)
+    return [vectors_dir / name for name in names]
 
 
 def expected_path_for_vector(vector_path: Path) -> Path:
@@ -153,6 +363,19 @@ def main() -> int:
     ap.add_argument("--vectors_dir", required=True, help="Path to contract/v1/harness/replay_vectors")
     ap.add_argument("--freeze", action="store_true", help="Write/overwrite expected outputs (*.expected.json)")
     ap.add_argument("--strict_missing", action="store_true", help="Fail if any artifacts are missing")
+    ap.add_argument(
+        "--hash_algo",
+        choices=sorted(FINGERPRINTERS),
+        default=HASH_ALGO_SHA256,
+        help="Fingerprint algorithm. sha256 (default) is audit-grade; blake2b is a faster cryptographic hash; "
+        "xxh3 is a faster non-cryptographic fingerprint. Expected outputs must be frozen with the same algorithm.",
+    )
+    ap.add_argument(
+        "--manifest_digest",
+        action="store_true",
+        help="Emit one digest over all artifacts (one hash context) instead of per-file fingerprints. "
+        "Expected outputs must be frozen in the same mode.",
+    )
     args = ap.parse_args()
 
     contract_root = Path(args.contract_root).resolve()
@@ -164,6 +387,9 @@ def main() -> int:
     if not vectors_dir.exists():
         print(f"ERROR: vectors_dir not found: {vectors_dir}")
         return 2
+    if args.hash_algo == HASH_ALGO_XXH3 and xxhash is None:
+        print("ERROR: --hash_algo xxh3 requires the optional 'xxhash' package (pip install xxhash)")
+        return 2
 
     vectors = discover_vectors(vectors_dir)
     if not vectors:
@@ -173,9 +399,15 @@ def main() -> int:
     failures: List[Tuple[str, List[str]]] = []
 
     for vpath in vectors:
-        vector = load_json(vpath)
+        if args.manifest_digest:
+            # The manifest digest hashes the vector itself; a separate fingerprint is unused.
+            vector, vector_fingerprint = load_json(vpath), None
+        else:
+            vector, vector_fingerprint = load_json_and_hash(vpath, args.hash_algo)
 
-        computed = compute_outputs(vpath, contract_root, vector)
+        computed = compute_outputs(
+            vpath, contract_root, vector, args.hash_algo, vector_fingerprint, manifest=args.manifest_digest
+        )
 
         if args.strict_missing and computed.get("missing_artifacts"):
             failures.append((vpath.name, [f"Missing artifacts: {computed['missing_artifacts']}"]))
@@ -185,6 +417,8 @@ def main() -> int:
 
         if args.freeze:
             write_json(exp_path, computed)
+            # Stay paranoid after mutating the tree: never reuse fingerprints across a freeze write.
+            memoized_file_digest.cache_clear()
             print(f"FREEZE OK: wrote {exp_path.name} for {vpath.name}")
             continue
 
@@ -0,0 +1,131 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import run_harness as H  # noqa: E402
+
+ROLES = """\
+roles:
+  - role_id: "INTERVIEW_AGENT"  # quoted
+    title: Interview
+  - role_id: ADMIN # note
+  - role_id: 'OPS_AGENT'
+"""
+
+LANES = """\
+lanes:
+  - lane_id: "intake"  # comment
+    allowed_callers:
+      roles: ["INTERVIEW_AGENT", ADMIN]  # flow
+    allowed_actions:
+      tools:  # block
+        - 'doc.read'
+        # a comment line inside the list
+        - doc.write # trailing
+  - lane_id: review
+    allowed_callers:
+      roles:
+        - "ADMIN"
+"""
+
+REGISTRY = """\
+tools:
+  - tool_name: "doc.read"  # quoted
+    enabled: yes
+    implementation_status: 'implemented' # note
+  - tool_name: doc.write
+    enabled: "yes"
+  - tool_name: doc.delete
+    enabled: False  # off
+"""
+
+# Sibling lists and nested keys that must not stand in for allowed_callers.roles,
+# allowed_actions.tools or a tool's own enabled flag.
+SCOPED_LANES = """\
+lanes:
+  - lane_id: gated
+    denied_callers:
+      roles: [B]
+    allowed_callers:
+      roles: [A]
+    forbidden_actions:
+      tools: [z]
+    allowed_actions:
+      tools: [x, y]
+  - allowed_callers: {roles: [C], note: x}
+    lane_id: flow
+    allowed_actions:
+      tools:
+      - w
+other:
+  roles: [Z]
+"""
+
+SCOPED_REGISTRY = """\
+tools:
+  - tool_name: limited
+    enabled: true
+    limits: {enabled: false}
+  - implementation_status: stub
+    limits:
+      enabled: true
+    tool_name: nested
+"""
+
+requires_libyaml = pytest.mark.skipif(H._YAML_LOADER is None, reason="libyaml-backed PyYAML not installed")
+
+
+def _sorted(lanes):
+    return [{k: sorted(v) for k, v in d.items()} for d in lanes]
+
+
+def test_extractors_read_quoted_and_commented_scalars():
+    assert H.extract_roles(ROLES) == ["INTERVIEW_AGENT", "ADMIN", "OPS_AGENT"]
+    assert _sorted(H.extract_lanes(LANES)) == [
+        {"intake": ["ADMIN", "INTERVIEW_AGENT"], "review": ["ADMIN"]},
+        {"intake": ["doc.read", "doc.write"], "review": []},
+    ]
+    assert H.extract_tool_registry(REGISTRY) == {
+        "doc.read": {"enabled": True, "implementation_status": "implemented"},
+        "doc.write": {"enabled": False, "implementation_status": None},
+        "doc.delete": {"enabled": False, "implementation_status": None},
+    }
+
+
+@requires_libyaml
+def test_yaml_and_extractor_paths_agree():
+    assert H.load_roles(ROLES) == H.extract_roles(ROLES)
+    assert _sorted(H.load_lanes(LANES)) == _sorted(H.extract_lanes(LANES))
+    assert H.load_tool_registry(REGISTRY) == H.extract_tool_registry(REGISTRY)
+
+
+def test_extractors_only_read_the_scoped_keys():
+    assert _sorted(H.extract_lanes(SCOPED_LANES)) == [
+        {"gated": ["A"], "flow": ["C"]},
+        {"gated": ["x", "y"], "flow": ["w"]},
+    ]
+    assert H.extract_tool_registry(SCOPED_REGISTRY) == {
+        "limited": {"enabled": True, "implementation_status": None},
+        "nested": {"enabled": None, "implementation_status": "stub"},
+    }
+
+
+@requires_libyaml
+def test_yaml_and_extractor_paths_agree_on_scoped_keys():
+    assert _sorted(H.load_lanes(SCOPED_LANES)) == _sorted(H.extract_lanes(SCOPED_LANES))
+    assert H.load_tool_registry(SCOPED_REGISTRY) == H.extract_tool_registry(SCOPED_REGISTRY)
+
+
+@requires_libyaml
+def test_non_string_entries_fall_back_to_extractors():
+    text = LANES.replace('        - "ADMIN"', "        - {name: ADMIN}\n        - 7")
+    assert _sorted(H.load_lanes(text)) == _sorted(H.extract_lanes(text))
+
+
+def test_without_libyaml_loaders_use_extractors(monkeypatch):
+    monkeypatch.setattr(H, "_YAML_LOADER", None)
+    assert H.load_roles(ROLES) == ["INTERVIEW_AGENT", "ADMIN", "OPS_AGENT"]
+    assert H.load_tool_registry(REGISTRY) == H.extract_tool_registry(REGISTRY)
@@ -10,17 +10,25 @@ Converts a .docx specification into clean HTML + CSS for publishing (GitHub Page
 """
 
 import argparse
-import html
 import os
+import posixpath
 import re
+import shutil
+import tempfile
 import unicodedata
-from typing import List, Tuple, Optional
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Optional
 
+import docx
 from docx import Document
-from docx.text.paragraph import Paragraph
-from docx.table import Table
-from docx.oxml.table import CT_Tbl
-from docx.oxml.text.paragraph import CT_P
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import nsmap, qn
+from docx.styles import BabelFish
+from lxml import etree
 
 
 # -----------------------------
@@ -28,69 +36,347 @@ from docx.oxml.text.paragraph import CT_P
 # -----------------------------
 
 DIVIDER_RE = re.compile(r"^\s*[_\-–—]{5,}\s*$")
-WHITESPACE_RE = re.compile(r"\s+")
+SLUG_STRIP_RE = re.compile(r"[^\w\s\-\.]")
+HEADING_STYLE_RE = re.compile(r"^Heading\s+(\d+)$", re.IGNORECASE)
+OL_MARKER_RE = re.compile(r"^\(?\d+[\.\)]\s+")
+# Leading list-marker residue: bullet/dash glyphs and the spaces between them.
+# norm_text leaves only single spaces as whitespace, so one lstrip removes the
+# whole run (what the old repeated-bullet + single-bullet regex pair did).
+BULLET_RESIDUE_CHARS = "•-–— "
+LABEL_RE = re.compile(r"^[A-Z][A-Za-z0-9 /&\-_]{1,40}:\s+")
 BULLET_GLYPHS = {"•", "‣", "∙", "◦", "▪", "–", "—", "●", "○"}
 
+# Body-level blocks and the paragraph properties the converter needs, compiled once.
+W_NS = {"w": nsmap["w"]}
+W_TBL = qn("w:tbl")
+BODY_BLOCKS_XPATH = etree.XPath("./w:p | ./w:tbl", namespaces=W_NS)
+P_STYLE_XPATH = etree.XPath("string(./w:pPr/w:pStyle/@w:val)", namespaces=W_NS)
+P_IS_LIST_XPATH = etree.XPath("boolean(./w:pPr/w:numPr)", namespaces=W_NS)
+TBL_ROWS_XPATH = etree.XPath("./w:tr", namespaces=W_NS)
+TR_CELLS_XPATH = etree.XPath("./w:tc", namespaces=W_NS)
+TC_PARAS_XPATH = etree.XPath("./w:p", namespaces=W_NS)
+
+# Run content of a paragraph in document order, as CT_P.text walks it: w:t text nodes
+# come back as plain str, the other run inner-content elements as elements.
+_RUN_CONTENT = "w:t/text() | w:tab | w:ptab | w:br | w:cr | w:noBreakHyphen"
+P_RUN_CONTENT_XPATH = etree.XPath(
+    " | ".join(f"./w:r/{c} | ./w:hyperlink/w:r/{c}" for c in _RUN_CONTENT.split(" | ")),
+    namespaces=W_NS,
+    smart_strings=False,
+)
+W_BR = qn("w:br")
+W_BR_TYPE = qn("w:type")
+RUN_CHAR_TEXT = {qn("w:tab"): "\t", qn("w:ptab"): "\t", qn("w:cr"): "\n", qn("w:noBreakHyphen"): "-"}
+
 def norm_text(s: str) -> str:
-    s = unicodedata.normalize("NFKC", s or "")
-    s = s.replace("\u00A0", " ")
-    s = WHITESPACE_RE.sub(" ", s).strip()
-    return s
+    if not s:
+        return ""
+    # NFKC leaves ASCII unchanged. It maps NBSP to a space, and str.split()
+    # already treats NBSP as whitespace, using the same set as the \s regex and
+    # strip(). So split/join both collapses and trims.
+    if not s.isascii():
+        s = unicodedata.normalize("NFKC", s)
+    return " ".join(s.split())
 
 def is_divider_line(s: str) -> bool:
-    return bool(DIVIDER_RE.match(norm_text(s)))
+    return is_divider_text(norm_text(s))
+
+def is_divider_text(txt: str) -> bool:
+    """
+    is_divider_line for text already passed through norm_text (which is idempotent).
+    """
+    # A divider needs at least five divider characters; skip the regex for anything shorter.
+    return len(txt) >= 5 and DIVIDER_RE.match(txt) is not None
+
+# SLUG_STRIP_RE as a translate table for ASCII text (derived from the regex itself).
+SLUG_STRIP_ASCII = str.maketrans({chr(i): None for i in range(128) if SLUG_STRIP_RE.match(chr(i))})
 
-def slugify(text: str, used: set) -> str:
+def slugify(text: str, used: Dict[str, int]) -> str:
     """
     Create stable-ish anchor IDs for headings.
+    used maps every ID handed out so far to the next numeric suffix to try for it.
     """
     t = norm_text(text).lower()
-    t = re.sub(r"[^\w\s\-\.]", "", t)
+    t = t.translate(SLUG_STRIP_ASCII) if t.isascii() else SLUG_STRIP_RE.sub("", t)
     t = t.replace(".", "-")
-    t = WHITESPACE_RE.sub("-", t).strip("-")
+    t = "-".join(t.split()).strip("-")
     if not t:
         t = "section"
-    base = t
-    i = 2
-    while t in used:
+    if t in used:
+        # Suffixes below used[base] are already taken (used only grows), so resume there.
+        base = t
+        i = used[base]
         t = f"{base}-{i}"
-        i += 1
-    used.add(t)
+        while t in used:
+            i += 1
+            t = f"{base}-{i}"
+        used[base] = i + 1
+    used[t] = 2
     return t
 
+class _Block(NamedTuple):
+    """
+    A body-level paragraph ("p") or table ("tbl"). For paragraphs, style_name is the
+    resolved paragraph style name, is_list whether numbering properties are set,
+    and text the python-docx Paragraph.text. For tables, cells is the raw text of
+    each cell, row by row (see table_cell_texts).
+    """
+    tag: str
+    style_name: str
+    is_list: bool
+    text: str
+    cells: List[List[str]]
+
+def paragraph_text(p) -> str:
+    """
+    Same string as python-docx Paragraph.text for a w:p element.
+    Plain-text paragraphs are joined in one call; only runs with tabs/breaks/hyphens
+    map elements to their text equivalents.
+    """
+    parts = P_RUN_CONTENT_XPATH(p)
+    try:
+        return "".join(parts)
+    except TypeError:
+        pass
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+        elif part.tag == W_BR:
+            # Line breaks read as "\n"; page and column breaks as "".
+            out.append("\n" if part.get(W_BR_TYPE, "textWrapping") == "textWrapping" else "")
+        else:
+            out.append(RUN_CHAR_TEXT[part.tag])
+    return "".join(out)
+
 def iter_block_items(parent):
     """
-    Yield Paragraph and Table objects in document order.
+    Yield _Block records for paragraphs and tables in document order.
+    Reads the XML directly (one XPath scan of the body, compiled XPath per paragraph)
+    instead of constructing Paragraph/pPr/numPr wrappers.
+    """
+    part = parent.part
+    style_names: Dict[Optional[str], str] = {}
+    for child in BODY_BLOCKS_XPATH(parent.element.body):
+        if child.tag == W_TBL:
+            yield _Block("tbl", "", False, "", table_cell_texts(child))
+            continue
+        style_id = P_STYLE_XPATH(child) or None
+        style_name = style_names.get(style_id)
+        if style_name is None:
+            # Same resolution as Paragraph.style (unknown id -> default style), once per id.
+            style = part.get_style(style_id, WD_STYLE_TYPE.PARAGRAPH)
+            style_name = (style.name or "").strip() if style else ""
+            style_names[style_id] = style_name
+        yield _Block("p", style_name, bool(P_IS_LIST_XPATH(child)), paragraph_text(child), [])
+
+def table_cell_texts(tbl) -> List[List[str]]:
+    """
+    Raw text of each cell, row by row, straight from the w:tbl XML.
+    Matches python-docx Table.rows -> _Row.cells -> _Cell.text without building
+    the wrappers: a horizontally spanned cell repeats once per grid column, a
+    vertical-merge continuation repeats the cell it continues, and cell text is
+    its direct paragraphs joined with newlines.
+    """
+    rows: List[List[str]] = []
+    for tr in TBL_ROWS_XPATH(tbl):
+        row: List[str] = []
+        for tc in TR_CELLS_XPATH(tr):
+            while tc.vMerge == "continue":
+                tc = tc._tc_above
+            text = "\n".join(paragraph_text(p) for p in TC_PARAS_XPATH(tc))
+            row.extend([text] * tc.grid_span)
+        rows.append(row)
+    return rows
+
+# -----------------------------
+# Low-memory read path (stdlib ElementTree)
+# -----------------------------
+
+# Opt-in (--low_memory) alternative to python-docx + lxml: word/document.xml is
+# streamed with ET.iterparse and each body-level block is dropped once it has been
+# read, so peak memory no longer scales with the parsed tree. The blocks it yields
+# are the same as iter_block_items() on the same file.
+
+REL_TAG = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+W_BODY = qn("w:body")
+W_P = qn("w:p")
+W_R = qn("w:r")
+W_T = qn("w:t")
+W_HYPERLINK = qn("w:hyperlink")
+W_TR = qn("w:tr")
+W_TC = qn("w:tc")
+W_VAL = qn("w:val")
+W_STYLE = qn("w:style")
+W_PPR_NUMPR = f"{qn('w:pPr')}/{qn('w:numPr')}"
+W_PPR_PSTYLE = f"{qn('w:pPr')}/{qn('w:pStyle')}"
+W_TCPR_VMERGE = f"{qn('w:tcPr')}/{qn('w:vMerge')}"
+W_TCPR_GRIDSPAN = f"{qn('w:tcPr')}/{qn('w:gridSpan')}"
+W_TRPR_GRIDBEFORE = f"{qn('w:trPr')}/{qn('w:gridBefore')}"
+DEFAULT_STYLES_XML = os.path.join(os.path.dirname(docx.__file__), "templates", "default-styles.xml")
+
+def _zip_related_part(z: zipfile.ZipFile, part_name: str, reltype: str) -> Optional[str]:
+    """
+    Zip member name of the first internal part related to part_name ("" for the
+    package itself) by reltype, or None.
     """
-    parent_elm = parent.element.body
-    for child in parent_elm.iterchildren():
-        if isinstance(child, CT_P):
-            yield Paragraph(child, parent)
-        elif isinstance(child, CT_Tbl):
-            yield Table(child, parent)
+    base, name = posixpath.split(part_name)
+    try:
+        rels = ET.fromstring(z.read(posixpath.join(base, "_rels", name + ".rels")))
+    except KeyError:
+        return None
+    for rel in rels.iter(REL_TAG):
+        if rel.get("Type") == reltype and rel.get("TargetMode") != "External":
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join(base, target))
+    return None
 
-def get_heading_level(p: Paragraph) -> Optional[int]:
+def _style_name_resolver(styles_root):
+    """
+    style id -> paragraph style name, resolved like python-docx part.get_style
+    (no id, unknown id, or a non-paragraph style -> the default paragraph style).
+    """
+    names: Dict[str, Optional[str]] = {}
+    default_name = ""
+    for st in styles_root.iter(W_STYLE):
+        is_para = st.get(qn("w:type"), "paragraph") == "paragraph"
+        name_el = st.find(qn("w:name"))
+        name_val = name_el.get(W_VAL) if name_el is not None else None
+        name = (BabelFish.internal2ui(name_val) or "").strip() if name_val is not None else ""
+        style_id = st.get(qn("w:styleId"))
+        if style_id is not None and style_id not in names:
+            names[style_id] = name if is_para else None
+        if is_para and st.get(qn("w:default")) in ("1", "true", "on"):
+            default_name = name  # the last default wins
+
+    def resolve(style_id: Optional[str]) -> str:
+        if style_id is None:
+            return default_name
+        name = names.get(style_id)
+        return default_name if name is None else name
+    return resolve
+
+def _stream_paragraph_text(p) -> str:
+    """paragraph_text for an ElementTree w:p."""
+    out = []
+    for child in p:
+        if child.tag == W_R:
+            runs = (child,)
+        elif child.tag == W_HYPERLINK:
+            runs = [r for r in child if r.tag == W_R]
+        else:
+            continue
+        for r in runs:
+            for e in r:
+                tag = e.tag
+                if tag == W_T:
+                    out.append(e.text or "")
+                elif tag == W_BR:
+                    out.append("\n" if e.get(W_BR_TYPE, "textWrapping") == "textWrapping" else "")
+                elif tag in RUN_CHAR_TEXT:
+                    out.append(RUN_CHAR_TEXT[tag])
+    return "".join(out)
+
+def _stream_table_cell_texts(tbl) -> List[List[str]]:
+    """table_cell_texts for an ElementTree w:tbl."""
+    rows: List[List[str]] = []
+    above: Optional[Dict[int, Any]] = None  # grid offset -> resolved tc, previous row
+    for tr in tbl.findall(W_TR):
+        gb = tr.find(W_TRPR_GRIDBEFORE)
+        offset = int(gb.get(W_VAL)) if gb is not None else 0
+        resolved: Dict[int, Any] = {}
+        row: List[str] = []
+        for tc in tr.findall(W_TC):
+            vm = tc.find(W_TCPR_VMERGE)
+            if vm is not None and vm.get(W_VAL, "continue") == "continue":
+                if above is None:
+                    raise ValueError("no tr above topmost tr in w:tbl")
+                if offset not in above:
+                    raise ValueError(f"no `tc` element at grid_offset={offset}")
+                top = above[offset]
+            else:
+                top = tc
+            resolved[offset] = top
+            gs = tc.find(W_TCPR_GRIDSPAN)
+            offset += int(gs.get(W_VAL)) if gs is not None else 1
+            top_gs = top.find(W_TCPR_GRIDSPAN)
+            text = "\n".join(_stream_paragraph_text(p) for p in top.findall(W_P))
+            row.extend([text] * (int(top_gs.get(W_VAL)) if top_gs is not None else 1))
+        rows.append(row)
+        above = resolved
+    return rows
+
+def iter_block_items_stream(docx_path: str):
+    """
+    Yield the same _Block records as iter_block_items(Document(docx_path)), reading
+    the package with zipfile + ElementTree.iterparse instead of python-docx/lxml.
+    """
+    with zipfile.ZipFile(docx_path) as z:
+        doc_part = _zip_related_part(z, "", RT.OFFICE_DOCUMENT)
+        if doc_part is None:
+            raise ValueError(f"no main document part in {docx_path}")
+        styles_part = _zip_related_part(z, doc_part, RT.STYLES)
+        if styles_part is not None:
+            styles_root = ET.fromstring(z.read(styles_part))
+        else:
+            # python-docx falls back to its built-in default styles part.
+            styles_root = ET.parse(DEFAULT_STYLES_XML).getroot()
+        resolve_style = _style_name_resolver(styles_root)
+        del styles_root
+
+        with z.open(doc_part) as f:
+            depth = 0
+            body = None
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and elem.tag == W_BODY:
+                        body = elem
+                    continue
+                depth -= 1
+                if depth != 2 or body is None:
+                    if elem is body:
+                        body = None
+                    continue
+                # A complete body-level child.
+                if elem.tag == W_P:
+                    ps = elem.find(W_PPR_PSTYLE)
+                    style_id = (ps.get(W_VAL) if ps is not None else None) or None
+                    yield _Block(
+                        "p",
+                        resolve_style(style_id),
+                        elem.find(W_PPR_NUMPR) is not None,
+                        _stream_paragraph_text(elem),
+                        [],
+                    )
+                elif elem.tag == W_TBL:
+                    yield _Block("tbl", "", False, "", _stream_table_cell_texts(elem))
+                body.remove(elem)
+
+def get_heading_level(p: _Block) -> Optional[int]:
     """
     Return 1..9 heading level if paragraph style is Heading N; else None.
     """
-    style_name = (p.style.name or "").strip() if p.style else ""
-    m = re.match(r"^Heading\s+(\d+)$", style_name, re.IGNORECASE)
+    return heading_level_for_style(p.style_name)
+
+@lru_cache(maxsize=None)
+def heading_level_for_style(style_name: str) -> Optional[int]:
+    # A document uses a handful of style names; match each one once.
+    m = HEADING_STYLE_RE.match(style_name)
     if m:
         return int(m.group(1))
     return None
 
-def paragraph_is_list_item(p: Paragraph) -> bool:
+def paragraph_is_list_item(p: _Block) -> bool:
     """
     Detect if paragraph is a list item (bulleted or numbered) by checking numbering properties.
     python-docx doesn't expose list types well, but numbering properties exist in XML.
     """
-    pPr = p._p.pPr
-    if pPr is None:
-        return False
-    numPr = pPr.numPr
-    return numPr is not None
+    return p.is_list
 
-def guess_list_kind(p: Paragraph) -> str:
+def guess_list_kind(p: _Block) -> str:
     """
     Best-effort list kind detection: 'ul' or 'ol'.
     If text starts with bullet glyph, treat as ul.
@@ -103,17 +389,20 @@ def guess_list_kind(p: Paragraph) -> str:
     first = txt[0]
     if first in BULLET_GLYPHS:
         return "ul"
-    if re.match(r"^\(?\d+[\.\)]\s+", txt):
+    if OL_MARKER_RE.match(txt):
         return "ol"
     # Many Word numbered lists lose explicit '1.' text because numbering is separate.
     # We conservatively default to ul unless text strongly indicates ol.
     return "ul"
 
+# Same mapping as html.escape(s, quote=False), applied in one pass.
+HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
 def escape(s: str) -> str:
-    return html.escape(s, quote=False)
+    return s.translate(HTML_ESCAPE_TABLE)
 
-def build_default_css() -> str:
-    return """\
+# Stylesheet written next to the HTML; one module-level string shared by every call.
+DEFAULT_CSS = """\
 :root{
   --bg:#0b0f14;
   --fg:#e8eef6;
@@ -223,30 +512,68 @@ tr:last-child td{border-bottom:0}
 .small{font-size:13px; color:var(--muted)}
 """
 
+def build_default_css() -> str:
+    return DEFAULT_CSS
+
+# Page shell around the converted body, built once at import. The prologue is
+# filled with the escaped title and the TOC block once the whole document is read.
+HTML_PROLOGUE = """<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8"/>
+  <meta name="viewport" content="width=device-width, initial-scale=1"/>
+  <title>{title}</title>
+  <link rel="stylesheet" href="ai-legal-spec.css"/>
+</head>
+<body>
+  <div class="container">
+    <div class="header">
+      <h1>{title}</h1>
+      <div class="meta">Generated from DOCX → HTML (deterministic conversion). Headings, lists, and tables preserved.</div>
+    </div>
+{toc}    """
+HTML_EPILOGUE = """
+    <p class="small">End of document.</p>
+  </div>
+</body>
+</html>
+"""
+
 # -----------------------------
 # Conversion
 # -----------------------------
 
 def build_toc(headings: List[Tuple[int, str, str]]) -> str:
     """
-    headings: list of (level, text, id)
-    We keep TOC to H2/H3 by default.
+    headings: list of (level, escaped text, id), already limited to what the TOC
+    lists (H2/H3 by default). The block carries its own indent and trailing
+    newline, so a page without a TOC gets no blank line in its place.
     """
     out = []
     out.append('<div class="toc">')
     out.append('<h2>Table of Contents</h2>')
     out.append("<ul>")
-    for lvl, text, hid in headings:
-        if lvl in (2, 3):
-            indent = ""  # keep flat-ish for readability
-            out.append(f'{indent}<li><a href="#{hid}">{escape(text)}</a></li>')
+    for lvl, text_html, hid in headings:
+        indent = ""  # keep flat-ish for readability
+        out.append(f'{indent}<li><a href="#{hid}">{text_html}</a></li>')
     out.append("</ul></div>")
-    return "\n".join(out)
+    return "    " + "\n".join(out) + "\n"
 
-def convert_docx_to_html(docx_path: str) -> Tuple[str, str]:
-    doc = Document(docx_path)
+# Body chunks are handed to the flush callback in batches of about this many parts.
+BODY_FLUSH_PARTS = 2048
+
+def render_docx_html(docx_path: str, flush: Callable[[List[str]], Any], low_memory: bool = False) -> Tuple[str, str, str]:
+    """
+    Convert docx_path, passing the HTML body to flush in order, one batch (list of
+    chunks) at a time, so the caller decides whether the body is kept or written out.
+    Returns (prologue, epilogue, css); the document is prologue + body + epilogue.
+    The prologue carries the title and TOC, so it is only known after the last block.
+    low_memory reads the .docx with the stdlib streaming parser (same output).
+    """
+    blocks = iter_block_items_stream(docx_path) if low_memory else iter_block_items(Document(docx_path))
 
-    used_ids = set()
+    used_ids: Dict[str, int] = {}
+    # (level, escaped text, id); the escaped text serves the <hN>, the TOC and the title.
     headings_for_toc: List[Tuple[int, str, str]] = []
 
     body_parts: List[str] = []
@@ -270,138 +597,180 @@ def convert_docx_to_html(docx_path: str) -> Tuple[str, str]:
             in_list = False
             list_kind = None
 
-    for block in iter_block_items(doc):
-        if isinstance(block, Paragraph):
+    # Locals for the per-block loop (avoids repeated global/attribute lookups).
+    append = body_parts.append
+    norm = norm_text
+    esc = escape
+    is_divider = is_divider_text
+    heading_level = heading_level_for_style
+    guess_kind = guess_list_kind
+    label_match = LABEL_RE.match
+    slug = slugify
+
+    for block in blocks:
+        if len(body_parts) >= BODY_FLUSH_PARTS:
+            flush(body_parts)
+            body_parts.clear()
+
+        if block.tag == "p":
             raw = block.text or ""
-            txt = norm_text(raw)
+            txt = norm(raw)
 
             # skip empty lines
             if not txt:
-                close_list()
+                if in_list:
+                    close_list()
                 continue
 
             # skip divider lines
-            if is_divider_line(txt):
-                close_list()
-                body_parts.append("<hr/>")
+            if is_divider(txt):
+                if in_list:
+                    close_list()
+                append("<hr/>")
                 continue
 
-            hlevel = get_heading_level(block)
+            hlevel = heading_level(block.style_name)
             if hlevel is not None:
-                close_list()
+                if in_list:
+                    close_list()
 
                 # Start a new visual section on H2 (major section)
                 if hlevel == 2:
                     open_new_section()
 
                 safe_level = min(max(hlevel, 1), 6)
-                hid = slugify(txt, used_ids)
-                headings_for_toc.append((safe_level, txt, hid))
-                body_parts.append(f'<h{safe_level} id="{hid}">{escape(txt)}</h{safe_level}>')
+                hid = slug(txt, used_ids)
+                txt_html = esc(txt)
+                headings_for_toc.append((safe_level, txt_html, hid))
+                append(f'<h{safe_level} id="{hid}">{txt_html}</h{safe_level}>')
                 continue
 
             # list handling
-            if paragraph_is_list_item(block):
-                kind = guess_list_kind(block)
+            if block.is_list:
+                kind = guess_kind(block)
 
                 # normalize list marker residue like "• • thing"
                 # we'll remove leading bullet glyphs that got duplicated in text
-                cleaned = txt
-                cleaned = re.sub(r"^([•\-\–—]\s*){2,}", "", cleaned).strip()
-                cleaned = re.sub(r"^[•\-\–—]\s*", "", cleaned).strip()
+                cleaned = txt.lstrip(BULLET_RESIDUE_CHARS)
 
                 if not in_list:
                     # open list
                     in_list = True
                     list_kind = kind
-                    body_parts.append(f"<{list_kind}>")
+                    append(f"<{list_kind}>")
                 else:
                     # if kind changes, close and reopen
                     if kind != list_kind:
                         close_list()
                         in_list = True
                         list_kind = kind
-                        body_parts.append(f"<{list_kind}>")
+                        append(f"<{list_kind}>")
 
-                body_parts.append(f"<li>{escape(cleaned)}</li>")
+                append(f"<li>{esc(cleaned)}</li>")
                 continue
 
             # normal paragraph
-            close_list()
+            if in_list:
+                close_list()
 
             # If a paragraph looks like "Label: content" with short label, style it slightly
-            if re.match(r"^[A-Z][A-Za-z0-9 /&\-_]{1,40}:\s+", txt):
-                body_parts.append(f"<p><strong>{escape(txt.split(':',1)[0])}:</strong> {escape(txt.split(':',1)[1].strip())}</p>")
+            if label_match(txt):
+                label, _, rest = txt.partition(":")
+                append(f"<p><strong>{esc(label)}:</strong> {esc(rest.strip())}</p>")
             else:
-                body_parts.append(f"<p>{escape(txt)}</p>")
+                append(f"<p>{esc(txt)}</p>")
 
-        elif isinstance(block, Table):
-            close_list()
+        elif block.tag == "tbl":
+            if in_list:
+                close_list()
             # Convert table
-            rows = block.rows
+            # Normalize every cell exactly once; the header check and the body share it.
+            rows = [[norm(c) for c in row] for row in block.cells]
             if not rows:
                 continue
 
-            body_parts.append("<table>")
+            append("<table>")
             # treat first row as header if it looks like headers (non-empty, short-ish)
-            first_cells = [norm_text(c.text) for c in rows[0].cells]
+            first_cells = rows[0]
             is_header = all(first_cells) and all(len(c) <= 60 for c in first_cells)
 
             if is_header:
-                body_parts.append("<thead><tr>")
+                append("<thead><tr>")
                 for cell in first_cells:
-                    body_parts.append(f"<th>{escape(cell)}</th>")
-                body_parts.append("</tr></thead>")
+                    append(f"<th>{esc(cell)}</th>")
+                append("</tr></thead>")
                 start = 1
             else:
                 start = 0
 
-            body_parts.append("<tbody>")
+            append("<tbody>")
             for r in rows[start:]:
-                body_parts.append("<tr>")
-                for c in r.cells:
-                    body_parts.append(f"<td>{escape(norm_text(c.text))}</td>")
-                body_parts.append("</tr>")
-            body_parts.append("</tbody></table>")
+                append("<tr>")
+                for c in r:
+                    append(f"<td>{esc(c)}</td>")
+                append("</tr>")
+            append("</tbody></table>")
 
     # close open structures
     if in_list:
         body_parts.append(f"</{list_kind}>")
     if open_section:
         body_parts.append("</section>")
+    flush(body_parts)
+    body_parts.clear()
 
     # Title heuristic: first Heading 1, else file name
-    title = "AI Legal Services Specification"
-    for lvl, text, hid in headings_for_toc:
+    title_html = escape("AI Legal Services Specification")
+    for lvl, text_html, hid in headings_for_toc:
         if lvl == 1:
-            title = text
+            title_html = text_html
             break
 
-    toc_html = build_toc(headings_for_toc)
+    # No H2/H3 -> no TOC block at all rather than an empty list.
+    toc_rows = [h for h in headings_for_toc if h[0] in (2, 3)]
+    toc_html = build_toc(toc_rows) if toc_rows else ""
 
-    html_out = f"""<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8"/>
-  <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <title>{escape(title)}</title>
-  <link rel="stylesheet" href="ai-legal-spec.css"/>
-</head>
-<body>
-  <div class="container">
-    <div class="header">
-      <h1>{escape(title)}</h1>
-      <div class="meta">Generated from DOCX → HTML (deterministic conversion). Headings, lists, and tables preserved.</div>
-    </div>
-    {toc_html}
-    {"".join(body_parts)}
-    <p class="small">End of document.</p>
-  </div>
-</body>
-</html>
-"""
+    prologue = HTML_PROLOGUE.format(title=title_html, toc=toc_html)
+    epilogue = HTML_EPILOGUE
     css_out = build_default_css()
-    return html_out, css_out
+    return prologue, epilogue, css_out
+
+def convert_docx_to_html_chunks(docx_path: str, low_memory: bool = False) -> Tuple[List[str], str]:
+    """
+    Returns (html_chunks, css). The HTML document is "".join(html_chunks); it is
+    kept in pieces so callers can stream it to a file without building one string.
+    """
+    body_parts: List[str] = []
+    prologue, epilogue, css_out = render_docx_html(docx_path, body_parts.extend, low_memory)
+    return [prologue, *body_parts, epilogue], css_out
+
+def write_docx_html(docx_path: str, out, low_memory: bool = False) -> str:
+    """
+    Write the HTML document for docx_path to the text file out and return the CSS.
+    With low_memory, body batches are spooled to a temporary file as they are
+    produced (the TOC has to come first), so memory does not grow with the length
+    of the document; otherwise the parts are collected in memory.
+    """
+    if not low_memory:
+        parts: List[str] = []
+        prologue, epilogue, css_out = render_docx_html(docx_path, parts.extend)
+        out.writelines([prologue, *parts, epilogue])
+        return css_out
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="") as spool:
+        prologue, epilogue, css_out = render_docx_html(docx_path, spool.writelines, low_memory)
+        out.write(prologue)
+        spool.seek(0)
+        shutil.copyfileobj(spool, out, 1 << 20)
+        out.write(epilogue)
+    return css_out
+
+def convert_docx_to_html(docx_path: str, low_memory: bool = False) -> Tuple[str, str]:
+    html_chunks, css_out = convert_docx_to_html_chunks(docx_path, low_memory)
+    return "".join(html_chunks), css_out
+
+def write_text(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
 
 def main():
     ap = argparse.ArgumentParser()
@@ -409,6 +778,8 @@ def main():
     ap.add_argument("--out_dir", default="site", help="Output directory (default: site)")
     ap.add_argument("--html_name", default="ai-legal-spec.html", help="HTML filename")
     ap.add_argument("--css_name", default="ai-legal-spec.css", help="CSS filename")
+    ap.add_argument("--low_memory", action="store_true",
+                    help="Stream word/document.xml with the stdlib parser (lower peak memory, same output)")
     args = ap.parse_args()
 
     if not os.path.exists(args.input_docx):
@@ -416,15 +787,17 @@ def main():
 
     os.makedirs(args.out_dir, exist_ok=True)
 
-    html_out, css_out = convert_docx_to_html(args.input_docx)
-
     html_path = os.path.join(args.out_dir, args.html_name)
     css_path = os.path.join(args.out_dir, args.css_name)
 
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html_out)
-    with open(css_path, "w", encoding="utf-8") as f:
-        f.write(css_out)
+    # The stylesheet does not depend on the document, so it is written on a worker
+    # thread while the .docx is parsed and converted.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        css_write = ex.submit(write_text, css_path, build_default_css())
+        # Stream the document through a 1 MiB buffer rather than joining it first.
+        with open(html_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            write_docx_html(args.input_docx, f, args.low_memory)
+        css_write.result()
 
     print(f"Saved HTML: {html_path}")
     print(f"Saved CSS : {css_path}")
@@ -1,84 +1,149 @@
+import bisect
 import re
-from pathlib import Path
-
-INDEX = Path("docs/index.html")
-
-ARCH_BLOCK = """
-<section id="architecture-visuals">
-  <h2>Architecture Visuals</h2>
-
-  <h3>Section 7 — Authoritative Architecture Map</h3>
-  <div style="margin: 12px 0 28px 0;">
-    <img
-      src="assets/svg/section7-authoritative.svg"
-      alt="Section 7 Authoritative Architecture Map"
-      style="max-width:100%;height:auto;border:1px solid #ddd;border-radius:8px;"
-    />
-  </div>
-
-  <h3>3 Layers — Figma Simplified Map</h3>
-  <div style="margin: 12px 0 28px 0;">
-    <img
-      src="assets/svg/layer3-figma.svg"
-      alt="3 Layers Figma Simplified Map"
-      style="max-width:100%;height:auto;border:1px solid #ddd;border-radius:8px;"
-    />
-  </div>
-
-  <h3>Bridge Map — Section 7 ↔ 3 Layers Mapping</h3>
-  <div style="margin: 12px 0 40px 0;">
-    <img
-      src="assets/svg/bridge-mapping.svg"
-      alt="Bridge Map Between Authoritative and Simplified Architecture"
-      style="max-width:100%;height:auto;border:1px solid #ddd;border-radius:8px;"
-    />
-  </div>
-
-  <hr/>
-</section>
-""".strip() + "\n"
-
-TOC_LI = '<li><a href="#architecture-visuals">Architecture Visuals</a></li>\n'
+
+from lxml import html as lhtml
+
+from _arch_block import ARCH_BLOCK, END_MARKER, INDEX, TOC_LI
+
+_CANONICAL_SECTION = ARCH_BLOCK.rstrip("\n")
+_SECTION_OPEN = '<section id="architecture-visuals">'
+
+# Start/end tags of the elements main() edits, skipping comments and script/style bodies.
+_TAG_RE = re.compile(
+    r"<!--.*?-->|<(script|style)\b.*?</\1\s*>|<(/?)(section|ul|p)\b[^>]*>",
+    flags=re.DOTALL | re.IGNORECASE,
+)
+
+
+def _already_normalized(html):
+    """True if html holds exactly one canonical block, right before the marker, and the TOC link."""
+    start = html.find(_SECTION_OPEN)
+    if start < 0 or html.find(_SECTION_OPEN, start + 1) >= 0:
+        return False
+    end = start + len(_CANONICAL_SECTION)
+    return (
+        html[start:end] == _CANONICAL_SECTION
+        and html[end:].lstrip().startswith(END_MARKER)
+        and TOC_LI.strip() in html
+    )
+
+
+class _Tags:
+    """Source offsets of the section/ul/p tags in html, for mapping lxml elements back to text."""
+
+    def __init__(self, html, root):
+        newlines = [m.start() for m in re.finditer("\n", html)]
+        self.tags = []  # (start, end, closing, name)
+        self.opening = {}  # (name, line of the closing ">") -> [index into self.tags]
+        for m in _TAG_RE.finditer(html):
+            if not m.group(3):
+                continue
+            name = m.group(3).lower()
+            if not m.group(2):
+                line = bisect.bisect_left(newlines, m.end() - 1) + 1
+                self.opening.setdefault((name, line), []).append(len(self.tags))
+            self.tags.append((m.start(), m.end(), bool(m.group(2)), name))
+        # lxml reports the line of the start tag's ">"; same-line siblings are told apart by order.
+        self.order = {}
+        seen = {}
+        for el in root.iter("section", "ul", "p"):
+            key = (el.tag, el.sourceline)
+            self.order[el] = seen.get(key, 0)
+            seen[key] = self.order[el] + 1
+
+    def span(self, el):
+        """(start, open_end, close_start, end) of el in the source text."""
+        indexes = self.opening.get((el.tag, el.sourceline), [])
+        k = self.order.get(el, len(indexes))
+        if k >= len(indexes):
+            raise SystemExit(f"Could not locate <{el.tag}> from line {el.sourceline}; aborting to avoid corruption.")
+        i = indexes[k]
+        start, open_end = self.tags[i][0], self.tags[i][1]
+        depth = 0
+        for tag_start, tag_end, closing, name in self.tags[i + 1:]:
+            if name != el.tag:
+                continue
+            if not closing:
+                depth += 1
+            elif depth:
+                depth -= 1
+            else:
+                return start, open_end, tag_start, tag_end
+        raise SystemExit(f"Unclosed <{el.tag}> at line {el.sourceline}; aborting to avoid corruption.")
+
 
 def main():
     if not INDEX.exists():
         raise SystemExit("docs/index.html not found")
 
-    html = INDEX.read_text(encoding="utf-8", errors="strict")
+    # newline="" keeps the original line endings, so untouched bytes are written back as-is.
+    with INDEX.open(encoding="utf-8", errors="strict", newline="") as f:
+        html = f.read()
+    if _already_normalized(html):
+        print("OK: Architecture Visuals already normalized; nothing to do.")
+        return
+
+    # One parse to locate what to edit; the edits themselves are spliced into the original text.
+    root = lhtml.document_fromstring(html)
+    tags = _Tags(html, root)
+    edits = []  # (start, end, replacement) over html
 
     # 1) Remove ALL existing architecture-visuals blocks (in case there are duplicates / misplaced).
-    html_new = re.sub(
-        r'\s*<section\s+id="architecture-visuals">.*?</section>\s*',
-        "\n",
-        html,
-        flags=re.DOTALL | re.IGNORECASE,
-    )
+    removed = []
+    for section in root.xpath('//section[@id="architecture-visuals"]'):
+        start, _, _, end = tags.span(section)
+        if removed and start < removed[-1][1]:
+            continue  # nested inside a block already being removed
+        removed.append((start, end))
+        while start > 0 and html[start - 1].isspace():
+            start -= 1
+        while end < len(html) and html[end].isspace():
+            end += 1
+        if edits:
+            start = max(start, edits[-1][1])
+        edits.append((start, end, "\n"))
+
+    def is_removed(pos):
+        return any(start <= pos < end for start, end in removed)
 
     # 2) Ensure TOC contains a link (insert as last item in TOC list).
-    if TOC_LI.strip() not in html_new:
-        m = re.search(
-            r'(<div\s+class="toc">.*?<ul>)(.*?)(</ul>)',
-            html_new,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-        if m:
-            prefix, items, suffix = m.group(1), m.group(2), m.group(3)
-            # Avoid duplicates if a variant exists
-            if 'href="#architecture-visuals"' not in items:
-                items = items.rstrip() + "\n" + TOC_LI
-            html_new = html_new[:m.start()] + prefix + items + suffix + html_new[m.end():]
-        else:
-            print("WARNING: TOC block not found; skipping TOC insertion.")
+    toc_lists = root.xpath('//div[@class="toc"]//ul')
+    if toc_lists:
+        toc_ul = toc_lists[0]
+        # Avoid duplicates if a variant exists
+        if not toc_ul.xpath('.//a[@href="#architecture-visuals"]'):
+            _, items_start, items_end, _ = tags.span(toc_ul)
+            if is_removed(items_end):
+                raise SystemExit("TOC list sits inside an architecture-visuals block; aborting to avoid corruption.")
+            cut = items_end
+            while cut > items_start and html[cut - 1].isspace():
+                cut -= 1
+            edits.append((cut, items_end, "\n" + TOC_LI))
+    else:
+        print("WARNING: TOC block not found; skipping TOC insertion.")
 
     # 3) Insert Architecture Visuals BEFORE the End-of-document marker.
-    marker = '<p class="small">End of document.</p>'
-    if marker not in html_new:
+    markers = [
+        start
+        for start, _, _, _ in map(tags.span, root.xpath('//p[@class="small"][normalize-space()="End of document."]'))
+        if not is_removed(start)
+    ]
+    if not markers:
         raise SystemExit("Could not find End of document marker; aborting to avoid corruption.")
+    edits.append((markers[0], markers[0], ARCH_BLOCK))
 
-    html_new = html_new.replace(marker, ARCH_BLOCK + marker, 1)
+    out = []
+    pos = 0
+    for start, end, text in sorted(edits, key=lambda e: (e[0], e[1])):
+        if start < pos:
+            raise SystemExit("Overlapping edits in docs/index.html; aborting to avoid corruption.")
+        out += (html[pos:start], text)
+        pos = end
+    out.append(html[pos:])
 
-    INDEX.write_text(html_new, encoding="utf-8", errors="strict")
+    with INDEX.open("w", encoding="utf-8", errors="strict", newline="") as f:
+        f.writelines(out)
     print("OK: normalized Architecture Visuals (removed old, inserted one canonical block).")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()